@@ -0,0 +1,28 @@
+"""
+Command-line entry point for the C.A.P.T Archive Converter.
+
+Qt and the window module are imported inside ``main`` so that importing
+this package stays cheap until the GUI is actually launched.
+"""
+
+import sys
+
+
+def main():
+    """Main entry point for the application."""
+    from PyQt6.QtWidgets import QApplication
+    from capt_archive_converter.main._window import ConvertWindow
+    from capt_archive_converter.utils.logger import shutdown_logging
+
+    app = QApplication(sys.argv)
+    app.setApplicationName("C.A.P.T - Archive Converter v1.0.0")
+    QApplication.setStyle("Fusion")
+    window = ConvertWindow()
+    window.show()
+    exit_code = app.exec()
+    shutdown_logging()  # Write out queued log records before exiting
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,36 @@
+import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Callable
-from capt_archive_converter.utils.arc_convert_util import ArchiveConversionError, ArchiveConverter as UtilsArchiveConverter
+from typing import Optional, Callable, NamedTuple
+from capt_archive_converter.utils.arc_convert_util import ArchiveConversionError, get_archive_converter
 from capt_archive_converter.utils.logger import get_operation_logger
 from capt_archive_converter.utils.arc_conv_helpers import (
     extract_rar_archive,
     extract_zip_archive,
     create_zip_archive,
     create_rar_archive,
-    create_per_file_progress_callback
+    stream_rar_to_zip_archive,
+    create_per_file_progress_callback,
+    PerFileStatusCallback,
+    BatchProgressCallback,
+    outputs_are_independent
 )
 
 
+# Shared by all instances; created when this module is first imported
+_LOG = get_operation_logger('archive_converter')
+
+
+class _FormatSpec(NamedTuple):
+    """Extract/create helpers and target naming for one source format."""
+    extract: Callable
+    create: Callable
+    target_suffix: str
+    target_format: str
+    stream: Optional[Callable] = None  # Direct archive-to-archive copy, skips the temp dir
+
+
 class ArchiveArchiveConverter:
     """
     Processor class for CBR <-> CBZ conversions.
@@ -19,10 +38,13 @@ class ArchiveArchiveConverter:
     
     # Class-level constant for format mappings (static, shared across instances)
     FORMAT_MAP = {
-        'CBR': {'extract': extract_rar_archive, 'create': create_zip_archive, 'target_suffix': '.cbz', 'target_format': 'CBZ'},
-        'CBZ': {'extract': extract_zip_archive, 'create': create_rar_archive, 'target_suffix': '.cbr', 'target_format': 'CBR'}
+        'CBR': _FormatSpec(extract_rar_archive, create_zip_archive, '.cbz', 'CBZ', stream_rar_to_zip_archive),
+        'CBZ': _FormatSpec(extract_zip_archive, create_rar_archive, '.cbr', 'CBR')
     }
 
+    # Upper bound on files converted at once; the work is mostly archive I/O
+    MAX_BATCH_WORKERS = 4
+
     def __init__(self, progress_callback=None, status_callback=None):
         """
         Initialize the ArchiveArchiveConverter.
@@ -31,10 +53,9 @@ class ArchiveArchiveConverter:
             progress_callback: Optional callback for progress updates.
             status_callback: Optional callback for status messages.
         """
-        self.logger = get_operation_logger('archive_converter')
         self.progress_callback = progress_callback
         self.status_callback = status_callback  # Store the status_callback
-        self.utils_converter = UtilsArchiveConverter()
+        self.utils_converter = get_archive_converter()
         
         # Reference the class-level constant (no recreation needed)
         self.format_map = self.FORMAT_MAP
@@ -62,19 +83,57 @@ class ArchiveArchiveConverter:
         """
         results = []
         total_files = len(file_paths)
+        if total_files > 1 and outputs_are_independent(file_paths, target_format):
+            return self._convert_batch_concurrent(file_paths, target_format, delete_original, status_callback)
         for idx, file_path in enumerate(file_paths):
             is_last_file = (idx == total_files - 1)
-            # Use the updated helper for per-file progress (0-100% per file)
-            file_progress_callback = create_per_file_progress_callback(
-                self.progress_callback, idx, total_files, is_last_file
-            )
+            # Only wrap callbacks that exist, so None skips per-file work downstream
+            file_progress_callback = None
+            if self.progress_callback is not None:
+                # Use the updated helper for per-file progress (0-100% per file)
+                file_progress_callback = create_per_file_progress_callback(
+                    self.progress_callback, idx, total_files, is_last_file
+                )
+            file_status_callback = None
+            if status_callback is not None:
+                file_status_callback = PerFileStatusCallback(status_callback, idx, total_files)
             
             result = self.convert_file(
-                Path(file_path), target_format, delete_original, progress_callback=file_progress_callback, status_callback=lambda msg: status_callback(f"File {idx + 1}/{total_files}: {msg}") if status_callback else None
+                Path(file_path), target_format, delete_original, progress_callback=file_progress_callback, status_callback=file_status_callback
             )
             results.append(result)
         return results
 
+    def _convert_batch_concurrent(
+        self,
+        file_paths: list,
+        target_format: str,
+        delete_original: bool,
+        status_callback: Optional[Callable[[str], None]]
+    ) -> list:
+        """
+        Convert a batch on a thread pool, reporting combined progress for all files.
+
+        Returns:
+            List of (original_path, converted_path, success, error_message), in input order.
+        """
+        total_files = len(file_paths)
+        batch_progress = BatchProgressCallback(self.progress_callback, total_files)
+        max_workers = min(self.MAX_BATCH_WORKERS, os.cpu_count() or 2, total_files)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.convert_file,
+                    Path(file_path),
+                    target_format,
+                    delete_original,
+                    progress_callback=batch_progress.for_file(idx) if self.progress_callback else None,
+                    status_callback=PerFileStatusCallback(status_callback, idx, total_files) if status_callback else None
+                )
+                for idx, file_path in enumerate(file_paths)
+            ]
+            return [future.result() for future in futures]
+
     def convert_file(
         self,
         file_path: Path,
@@ -103,6 +162,10 @@ class ArchiveArchiveConverter:
 
         try:
             source_format = self.detect_archive_format(original_path)
+            if source_format and source_format.upper() == target_format.upper():
+                # Already in the target format: nothing to convert, and nothing to delete
+                _LOG.info(f"Skipping {original_path}: already {source_format.upper()}.")
+                return str(original_path), str(original_path), True, ""
             if (target_format == "cbz" and source_format == "CBR") or (target_format == "cbr" and source_format == "CBZ"):
                 if status_callback:
                     status_callback(f"Processing {file_path.name}...")
@@ -112,16 +175,16 @@ class ArchiveArchiveConverter:
 
             success = converted_path.exists()
             if success:
-                self.logger.info(f"Converted {original_path} to {converted_path}.")
+                _LOG.info(f"Converted {original_path} to {converted_path}.")
                 if delete_original:
                     original_path.unlink()
-                    self.logger.info(f"Deleted original file: {original_path}")
+                    _LOG.info(f"Deleted original file: {original_path}")
             else:
                 error_message = f"Conversion failed: {converted_path} was not created."
-                self.logger.error(error_message)
+                _LOG.error(error_message)
         except Exception as exc:
             error_message = str(exc)
-            self.logger.error(f"Failed to convert {original_path}: {error_message}")
+            _LOG.error(f"Failed to convert {original_path}: {error_message}")
 
         return str(original_path), str(converted_path), success, error_message
 
@@ -137,7 +200,8 @@ class ArchiveArchiveConverter:
         create_start: int = 60,
         create_end: int = 90
     ) -> Path:
-        self.logger.info(f"Starting {source_format} to {self.format_map[source_format]['target_format']} conversion: {source_path}")
+        spec = self.format_map[source_format]
+        _LOG.info(f"Starting {source_format} to {spec.target_format} conversion: {source_path}")
 
         if not source_path.exists():
             raise ArchiveConversionError(f"Source {source_format} file not found: {source_path}")
@@ -146,31 +210,43 @@ class ArchiveArchiveConverter:
             raise ArchiveConversionError(f"File is not a valid {source_format} archive: {source_path}")
 
         if output_path is None:
-            output_path = source_path.with_suffix(self.format_map[source_format]['target_suffix'])
+            output_path = source_path.with_suffix(spec.target_suffix)
 
         try:
+            if spec.stream:
+                # CBR -> CBZ: copy entries directly, no temp directory round-trip
+                if status_callback:
+                    status_callback(f"Packing into {spec.target_format} archive...")
+                if progress_callback:
+                    progress_callback(extract_start, 100)
+                spec.stream(source_path, output_path, progress_callback, extract_start, create_end)
+                if progress_callback:
+                    progress_callback(100, 100)
+                _LOG.info(f"{source_format} to {spec.target_format} conversion complete: {output_path}")
+                return output_path
+
             if status_callback:
                 status_callback(f"Extracting {source_format} archive...")
             with tempfile.TemporaryDirectory() as temp_dir:
                 temp_path = Path(temp_dir)
                 if progress_callback:
                     progress_callback(extract_start, 100)
-                self.format_map[source_format]['extract'](source_path, temp_path, progress_callback, extract_start, extract_end)
+                spec.extract(source_path, temp_path, progress_callback, extract_start, extract_end)
                 if progress_callback:
                     progress_callback(extract_end, 100)
                 if status_callback:
                     status_callback("Converting format...")
-                self.format_map[source_format]['create'](temp_path, output_path, progress_callback, create_start, create_end)
+                spec.create(temp_path, output_path, progress_callback, create_start, create_end)
                 if status_callback:
-                    status_callback(f"Packing into {self.format_map[source_format]['target_format']} archive...")
+                    status_callback(f"Packing into {spec.target_format} archive...")
             if status_callback:
                 status_callback("Cleaning up temporary files...")
             # Cleanup happens here (temp dir deleted)
             if progress_callback:
                 progress_callback(100, 100)  # Now called after cleanup
-            self.logger.info(f"{source_format} to {self.format_map[source_format]['target_format']} conversion complete: {output_path}")
+            _LOG.info(f"{source_format} to {spec.target_format} conversion complete: {output_path}")
             return output_path
         except Exception as e:
-            error_msg = f"Failed to convert {source_format} to {self.format_map[source_format]['target_format']}: {str(e)}"
-            self.logger.error(error_msg)
+            error_msg = f"Failed to convert {source_format} to {spec.target_format}: {str(e)}"
+            _LOG.error(error_msg)
             raise ArchiveConversionError(error_msg)
@@ -1,13 +1,138 @@
-import tempfile
+import io
+import math
+import mmap
+import multiprocessing
+import os
+import queue
+import threading
+import weakref
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Callable
 import fitz  # PyMuPDF
 from PIL import Image
 
-from capt_archive_converter.utils.arc_convert_util import ArchiveConversionError, ArchiveConverter as UtilsArchiveConverter
+try:
+    import img2pdf  # Optional: embeds JPEG/PNG pages into the PDF without re-encoding
+except ImportError:
+    img2pdf = None
+
+from capt_archive_converter.utils.arc_convert_util import ArchiveConversionError, get_archive_converter
 from capt_archive_converter.utils.logger import get_operation_logger
-from capt_archive_converter.utils.arc_conv_helpers import create_zip_archive, create_per_file_progress_callback
+from capt_archive_converter.utils.arc_conv_helpers import (
+    get_zip_compression,
+    iter_files,
+    DEFAULT_DEFLATE_LEVEL,
+    create_per_file_progress_callback,
+    PerFileStatusCallback,
+    outputs_are_independent
+)
+
+# zlib level for rendered PDF pages: level 1 encodes several times faster than
+# the default (6) and pages stay lossless, at the cost of somewhat larger files
+PNG_COMPRESS_LEVEL = 1
+
+# Default rasterization resolution for PDF pages; 150 DPI is a typical comic
+# reader target, with a quarter of the pixels of a 300 DPI render
+DEFAULT_RENDER_DPI = 150
+
+# Image modes Pillow's PDF writer embeds directly; anything else (RGBA, P, LA,
+# ...) must be converted to RGB first
+PDF_NATIVE_MODES = frozenset({'1', 'L', 'RGB', 'CMYK'})
+
+# PDFs at least this large are memory-mapped instead of read through stdio
+MMAP_MIN_PDF_SIZE = 50 * 1024 * 1024
+
+
+@contextmanager
+def _open_pdf(pdf_path):
+    """
+    Open a PDF with PyMuPDF, closing it on exit. PDFs of at least
+    MMAP_MIN_PDF_SIZE bytes are memory-mapped, so pages are read straight from
+    the page cache; smaller files are opened by name, where mmap setup costs
+    more than it saves.
+
+    Args:
+        pdf_path: Path to the PDF file.
+
+    Yields:
+        fitz.Document: The open document.
+    """
+    if os.path.getsize(pdf_path) < MMAP_MIN_PDF_SIZE:
+        with fitz.open(str(pdf_path)) as doc:
+            yield doc
+        return
+    with open(pdf_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+        try:
+            try:
+                doc = fitz.open("pdf", view)
+            except TypeError:
+                # Older PyMuPDF releases only accept bytes-like streams they copy
+                doc = fitz.open(str(pdf_path))
+            with doc:
+                yield doc
+        finally:
+            # The mapping can only be closed once no buffer views remain
+            view.release()
+
+
+def _page_name(page_number: int) -> str:
+    """Archive member name for a 0-based PDF page index."""
+    return f"page_{page_number + 1:03d}.png"
+
+
+def _render_page_png(page, matrix) -> bytes:
+    """
+    Render one PDF page to PNG bytes in memory.
+
+    Args:
+        page: The fitz.Page to render.
+        matrix: Shared fitz.Matrix setting the render resolution.
+
+    Returns:
+        bytes: The encoded PNG.
+    """
+    pix = page.get_pixmap(matrix=matrix, colorspace=fitz.csRGB, alpha=False)
+    png_data = pix.pil_tobytes(format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+    # Free the decoded bitmap now rather than whenever the frame is collected
+    del pix
+    return png_data
+
+
+def _render_pdf_pages(pdf_path: str, page_numbers: range, dpi: int = DEFAULT_RENDER_DPI) -> list:
+    """
+    Render a range of PDF pages to PNG bytes. Runs in a worker process,
+    because PyMuPDF documents must not be shared between threads.
+
+    Args:
+        pdf_path: Path to the PDF file.
+        page_numbers: 0-based page indices to render.
+        dpi: Rasterization resolution.
+
+    Returns:
+        (member_name, png_bytes) pairs, in page order.
+    """
+    pages = []
+    matrix = fitz.Matrix(dpi / 72.0, dpi / 72.0)
+    with _open_pdf(pdf_path) as doc:
+        for i in page_numbers:
+            pages.append((_page_name(i), _render_page_png(doc.load_page(i), matrix)))
+    return pages
+
+
+def _convert_file_in_process(file_path: str, target_format: str, delete_original: bool) -> tuple:
+    """
+    Convert one file in a batch worker process. Callbacks cannot cross the
+    process boundary, and pages are rendered serially so pools do not nest.
+
+    Returns:
+        (original_path, converted_path, success, error_message)
+    """
+    converter = PdfArchiveConverter(render_workers=1)
+    return converter.convert_file(Path(file_path), target_format, delete_original)
 
 
 class PdfArchiveConverter:
@@ -15,22 +140,63 @@ class PdfArchiveConverter:
     Processor class for PDF <-> CBZ conversions.
     """
 
-    def __init__(self, progress_callback=None, status_callback=None):
+    # PDFs with at least this many pages are rendered on a process pool. A
+    # spawned render worker costs about 0.25 s to start (fitz/PIL import) against
+    # about 40 ms per 150 DPI page, so a new pool pays off from roughly 9 pages on
+    # 4 cores and 13 on 2; later PDFs in a batch reuse the running pool
+    PARALLEL_RENDER_MIN_PAGES = 16
+    # Page chunks per render process, for finer-grained progress
+    RENDER_CHUNKS_PER_WORKER = 4
+    # Rendered pages allowed to wait for the CBZ writer thread
+    PAGE_QUEUE_SIZE = 8
+
+    def __init__(self, progress_callback=None, status_callback=None, render_workers=None):
         """
         Initialize the PdfArchiveConverter.
 
         Args:
             progress_callback: Optional callback for progress updates.
             status_callback: Optional callback for status messages.
+            render_workers: Max processes for rendering one PDF's pages (default: CPU count).
         """
         self.logger = get_operation_logger('pdf_converter')
         self.progress_callback = progress_callback
         self.status_callback = status_callback  # Add status_callback
-        self.utils_converter = UtilsArchiveConverter()
+        self.render_workers = render_workers
+        self.render_pool = None  # Page-render process pool, started on first use and reused
+        self.utils_converter = get_archive_converter()
+        # Bare extensions ("jpg"), for matching zip member names without building Paths
+        self.image_extensions = frozenset(
+            ext.lstrip('.') for ext in self.utils_converter.supported_image_extensions
+        )
 
     def detect_archive_format(self, archive_path: Path) -> Optional[str]:
         return self.utils_converter.detect_archive_format(archive_path)
 
+    def _get_render_pool(self) -> ProcessPoolExecutor:
+        """
+        Return the page-render process pool, starting it on first use. Each
+        spawned worker pays its fitz/PIL import once, so the pool serves every
+        later PDF until close() rather than being rebuilt per file.
+        """
+        if self.render_pool is None:
+            # spawn: forking a process that is running Qt threads is unsafe
+            self.render_pool = ProcessPoolExecutor(
+                max_workers=self.render_workers or os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            # Converters dropped without close() still stop their workers
+            weakref.finalize(self, self.render_pool.shutdown, wait=False)
+        return self.render_pool
+
+    def close(self):
+        """
+        Shut down the page-render process pool, if one was started.
+        """
+        if self.render_pool is not None:
+            self.render_pool.shutdown()
+            self.render_pool = None
+
     def convert_batch(
         self,
         file_paths: list,
@@ -40,6 +206,11 @@ class PdfArchiveConverter:
     ) -> list:
         """
         Convert a batch of comic archives to the target format.
+        Without a progress callback, independent files are converted in
+        parallel processes; with one, files go one at a time so progress is
+        reported per page rather than per finished file. ConversionWorker
+        always passes a progress callback, so GUI batches only get the
+        page-level render pool, never file-level parallelism.
 
         Args:
             file_paths: List of full file paths to convert.
@@ -52,17 +223,76 @@ class PdfArchiveConverter:
         """
         results = []
         total_files = len(file_paths)
-        for idx, file_path in enumerate(file_paths):
-            is_last_file = (idx == total_files - 1)
-            # Use the updated helper for per-file progress (0-100% per file)
-            file_progress_callback = create_per_file_progress_callback(
-                self.progress_callback, idx, total_files, is_last_file
-            )
-            
-            result = self.convert_file(
-                Path(file_path), target_format, delete_original, progress_callback=file_progress_callback, status_callback=lambda msg: status_callback(f"File {idx + 1}/{total_files}: {msg}") if status_callback else None
-            )
-            results.append(result)
+        if (
+            self.progress_callback is None
+            and total_files > 1
+            and (os.cpu_count() or 1) > 1
+            and outputs_are_independent(file_paths, target_format)
+        ):
+            return self._convert_batch_parallel(file_paths, target_format, delete_original, status_callback)
+        try:
+            for idx, file_path in enumerate(file_paths):
+                is_last_file = (idx == total_files - 1)
+                # Only wrap callbacks that exist, so None skips per-file work downstream
+                file_progress_callback = None
+                if self.progress_callback is not None:
+                    # Use the updated helper for per-file progress (0-100% per file)
+                    file_progress_callback = create_per_file_progress_callback(
+                        self.progress_callback, idx, total_files, is_last_file
+                    )
+                file_status_callback = None
+                if status_callback is not None:
+                    file_status_callback = PerFileStatusCallback(status_callback, idx, total_files)
+
+                result = self.convert_file(
+                    Path(file_path), target_format, delete_original, progress_callback=file_progress_callback, status_callback=file_status_callback
+                )
+                results.append(result)
+        finally:
+            # The render pool is shared by every PDF in the batch
+            self.close()
+        return results
+
+    def _convert_batch_parallel(
+        self,
+        file_paths: list,
+        target_format: str,
+        delete_original: bool,
+        status_callback: Optional[Callable[[str], None]]
+    ) -> list:
+        """
+        Convert a batch with one worker process per file (up to the CPU count).
+        Only used without a progress callback; status is reported as each file finishes.
+
+        Returns:
+            List of (original_path, converted_path, success, error_message), in input order.
+        """
+        total_files = len(file_paths)
+        max_workers = min(total_files, os.cpu_count() or 1)
+        # spawn: forking a process that is running Qt threads is unsafe
+        mp_context = multiprocessing.get_context('spawn')
+        results = [None] * total_files
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+            futures = {
+                executor.submit(_convert_file_in_process, str(file_path), target_format, delete_original): idx
+                for idx, file_path in enumerate(file_paths)
+            }
+            if status_callback:
+                status_callback(f"Converting {total_files} files in {max_workers} processes...")
+            for future in as_completed(futures):
+                idx = futures[future]
+                try:
+                    results[idx] = future.result()
+                except Exception as e:
+                    # Worker process crashed; convert_file itself never raises
+                    file_path = Path(file_paths[idx])
+                    results[idx] = (
+                        str(file_path), str(file_path.with_suffix(f'.{target_format.lower()}')), False, str(e)
+                    )
+                if status_callback:
+                    PerFileStatusCallback(status_callback, idx, total_files)(
+                        f"Finished {Path(file_paths[idx]).name}"
+                    )
         return results
 
     def convert_file(
@@ -93,15 +323,23 @@ class PdfArchiveConverter:
 
         try:
             source_format = self.detect_archive_format(original_path)
+            if source_format and source_format.upper() == target_format.upper():
+                # Already in the target format: nothing to convert, and nothing to delete
+                self.logger.info(f"Skipping {original_path}: already {source_format.upper()}.")
+                return str(original_path), str(original_path), True, ""
             # Case-insensitive checks for robustness
             if (target_format.lower() == "cbz" and source_format.upper() == "PDF") or \
                (target_format.lower() == "pdf" and source_format.upper() == "CBZ"):
                 if status_callback:
                     status_callback("Initializing PDF converter...")
                 if target_format.lower() == "cbz":
-                    self.convert_pdf_to_cbz(original_path, converted_path, progress_callback, status_callback)
+                    self.convert_pdf_to_cbz(
+                        original_path, converted_path, progress_callback, status_callback, source_format=source_format.upper()
+                    )
                 else:
-                    self.convert_cbz_to_pdf(original_path, converted_path, progress_callback, status_callback)
+                    self.convert_cbz_to_pdf(
+                        original_path, converted_path, progress_callback, status_callback, source_format=source_format.upper()
+                    )
             else:
                 raise ArchiveConversionError("Unsupported conversion type or file extension.")
 
@@ -129,14 +367,40 @@ class PdfArchiveConverter:
         extract_start: int = 10,
         extract_end: int = 80,
         create_start: int = 90,
-        create_end: int = 100
+        create_end: int = 100,
+        source_format: Optional[str] = None,
+        dpi: int = DEFAULT_RENDER_DPI
     ) -> Path:
+        """
+        Render every page of a PDF to PNG and pack the pages into a CBZ.
+
+        DPI is the main cost/quality tradeoff: pixel count grows with its
+        square, so render time, memory and archive size do too. 150 DPI reads
+        well on screens; 300 DPI suits print-quality scans at ~4x the cost.
+        Pages are rendered without an alpha channel, as comic pages are opaque.
+
+        Args:
+            pdf_path: Path to the PDF file.
+            output_path: Path of the CBZ to write (default: pdf_path with .cbz).
+            progress_callback: Optional callback for progress updates.
+            status_callback: Optional callback for status messages.
+            extract_start, extract_end, create_start, create_end: Progress range
+                for the rendering and packing phases.
+            source_format: Format already detected by the caller, if any.
+            dpi: Rasterization resolution for the pages.
+
+        Returns:
+            Path: Path of the created CBZ.
+        """
         self.logger.info(f"Starting PDF to CBZ conversion: {pdf_path}")
 
         if not pdf_path.exists():
             raise ArchiveConversionError(f"Source PDF file not found: {pdf_path}")
 
-        if self.detect_archive_format(pdf_path) != 'PDF':
+        # convert_file passes the format it already detected; only probe when called directly
+        if source_format is None:
+            source_format = self.detect_archive_format(pdf_path)
+        if source_format != 'PDF':
             raise ArchiveConversionError(f"File is not a valid PDF: {pdf_path}")
 
         if output_path is None:
@@ -145,46 +409,119 @@ class PdfArchiveConverter:
         try:
             if status_callback:
                 status_callback(f"Processing {pdf_path.name}...")
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                if progress_callback:
-                    progress_callback(extract_start, 100)  # 10% - Setup/validation done
-                if status_callback:
-                    status_callback("Extracting PDF pages...")
+            if progress_callback:
+                progress_callback(extract_start, 100)  # 10% - Setup/validation done
+            if status_callback:
+                status_callback("Extracting PDF pages...")
 
-                doc = fitz.open(str(pdf_path))
+            with _open_pdf(pdf_path) as doc:
                 total_pages = doc.page_count
 
                 if progress_callback:
                     progress_callback(extract_start + 20, 100)  # Adjusted for parameterization
 
-                for i, page in enumerate(doc):
-                    pix = page.get_pixmap()
-                    img_path = temp_path / f"page_{i + 1:03d}.png"
-                    pix.save(str(img_path))
-                    if progress_callback and total_pages > 0:
-                        progress = extract_start + int(((i + 1) / total_pages) * (extract_end - extract_start))
-                        progress_callback(progress, 100)
-
-                doc.close()
-
-                if progress_callback:
-                    progress_callback(create_start, 100)  # 90% - Archive creation done
-                if status_callback:
-                    status_callback("Packing into CBZ archive...")
-
-                create_zip_archive(temp_path, output_path, progress_callback, create_start, create_end)
+                # Pages are rendered to memory and packed into the CBZ by a writer
+                # thread while rendering continues; nothing touches a temp directory
+                page_queue = queue.Queue(maxsize=self.PAGE_QUEUE_SIZE)
+                writer_errors = []
+                with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_STORED) as zip_file:
+                    writer = threading.Thread(
+                        target=self._write_pages_from_queue, args=(zip_file, page_queue, writer_errors)
+                    )
+                    writer.start()
+                    try:
+                        max_workers = min(self.render_workers or os.cpu_count() or 1, total_pages)
+                        if total_pages >= self.PARALLEL_RENDER_MIN_PAGES and max_workers > 1:
+                            self._render_pages_parallel(
+                                pdf_path, total_pages, max_workers, page_queue.put,
+                                progress_callback, extract_start, extract_end, dpi
+                            )
+                        else:
+                            matrix = fitz.Matrix(dpi / 72.0, dpi / 72.0)
+                            for i in range(total_pages):
+                                page = doc.load_page(i)
+                                png_data = _render_page_png(page, matrix)
+                                # Drop the page before put() may block on a full queue
+                                del page
+                                page_queue.put((_page_name(i), png_data))
+                                if progress_callback and total_pages > 0:
+                                    progress = extract_start + int(((i + 1) / total_pages) * (extract_end - extract_start))
+                                    progress_callback(progress, 100)
 
-                if progress_callback:
-                    progress_callback(create_end, 100)  # 100% - Complete
-                if status_callback:
-                    status_callback("Cleaning up temporary files...")
+                        if progress_callback:
+                            progress_callback(create_start, 100)  # 90% - Rendering done
+                        if status_callback:
+                            status_callback("Packing into CBZ archive...")
+                    finally:
+                        page_queue.put(None)  # Tell the writer no more pages are coming
+                        writer.join()
+                    if writer_errors:
+                        raise writer_errors[0]
+
+            if progress_callback:
+                progress_callback(create_end, 100)  # 100% - Complete
+            return output_path
         except Exception as e:
             error_msg = f"Failed to convert PDF to CBZ: {str(e)}"
             self.logger.error(error_msg)
             raise ArchiveConversionError(error_msg)
 
+    def _write_pages_from_queue(self, zip_file: zipfile.ZipFile, page_queue: queue.Queue, errors: list):
+        """
+        Writer thread body: add each (name, data) page from page_queue to
+        zip_file until a None sentinel arrives. The first error is recorded and
+        later pages are drained so the renderer never blocks on a full queue.
+        """
+        while True:
+            page = page_queue.get()
+            if page is None:
+                return
+            if errors:
+                continue
+            try:
+                zip_file.writestr(*page)
+            except Exception as e:
+                errors.append(e)
+
+    def _render_pages_parallel(
+        self,
+        pdf_path: Path,
+        total_pages: int,
+        max_workers: int,
+        page_sink: Callable[[tuple], None],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        extract_start: int = 10,
+        extract_end: int = 80,
+        dpi: int = DEFAULT_RENDER_DPI
+    ):
+        """
+        Render all PDF pages on the converter's process pool, each worker
+        opening its own copy of the document. Rendered (name, data) pages are
+        passed to page_sink in page order as each chunk finishes.
+        """
+        chunk_size = math.ceil(total_pages / (max_workers * self.RENDER_CHUNKS_PER_WORKER))
+        chunks = [range(start, min(start + chunk_size, total_pages)) for start in range(0, total_pages, chunk_size)]
+        executor = self._get_render_pool()
+        futures = [
+            executor.submit(_render_pdf_pages, str(pdf_path), chunk, dpi)
+            for chunk in chunks
+        ]
+        rendered = 0
+        try:
+            # Collect in submission order so pages enter the archive in order
+            for future in futures:
+                pages = future.result()
+                for page in pages:
+                    page_sink(page)
+                rendered += len(pages)
+                if progress_callback:
+                    progress = extract_start + int((rendered / total_pages) * (extract_end - extract_start))
+                    progress_callback(progress, 100)
+        finally:
+            # The pool outlives this PDF, so drop its chunks that have not started
+            for future in futures:
+                future.cancel()
+
     def convert_cbz_to_pdf(
         self,
         cbz_path: Path,
@@ -194,14 +531,18 @@ class PdfArchiveConverter:
         extract_start: int = 10,
         extract_end: int = 80,
         create_start: int = 90,
-        create_end: int = 100
+        create_end: int = 100,
+        source_format: Optional[str] = None
     ) -> Path:
         self.logger.info(f"Starting CBZ to PDF conversion: {cbz_path}")
 
         if not cbz_path.exists():
             raise ArchiveConversionError(f"Source CBZ file not found: {cbz_path}")
 
-        if self.detect_archive_format(cbz_path) != 'CBZ':
+        # convert_file passes the format it already detected; only probe when called directly
+        if source_format is None:
+            source_format = self.detect_archive_format(cbz_path)
+        if source_format != 'CBZ':
             raise ArchiveConversionError(f"File is not a valid CBZ archive: {cbz_path}")
 
         if output_path is None:
@@ -210,80 +551,114 @@ class PdfArchiveConverter:
         try:
             if status_callback:
                 status_callback(f"Processing {cbz_path.name}...")
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                with zipfile.ZipFile(cbz_path, 'r') as zip_file:
-                    image_files = [
-                        f for f in zip_file.namelist()
-                        if Path(f).suffix.lower() in self.utils_converter.supported_image_extensions
-                    ]
-                    image_files.sort()
-                    total_images = len(image_files)
-                    if total_images == 0:
-                        raise ArchiveConversionError("No images found in CBZ archive.")
-
-                    if status_callback:
-                        status_callback("Extracting images from CBZ...")
-
-                    extracted_images = []
-                    for i, img_name in enumerate(image_files):
-                        img_path = temp_path / Path(img_name).name
-                        with zip_file.open(img_name) as img_file, open(img_path, 'wb') as out_file:
-                            out_file.write(img_file.read())
-                        extracted_images.append(str(img_path))
-                        if progress_callback:
-                            progress = extract_start + int(((i + 1) / total_images) * (extract_end - extract_start))
-                            progress_callback(progress, 100)
-
-                pil_images = []
-                for img_file in extracted_images:
-                    img = Image.open(img_file)
-                    if img.mode != 'RGB':
-                        img = img.convert('RGB')
-                    pil_images.append(img)
-
-                if not pil_images:
-                    raise ArchiveConversionError("No valid images to convert to PDF.")
+            with zipfile.ZipFile(cbz_path, 'r') as zip_file:
+                image_files = sorted(
+                    (f for f in zip_file.namelist()
+                     if f.rpartition('.')[2].lower() in self.image_extensions),
+                    key=str.lower
+                )
+                total_images = len(image_files)
+                if total_images == 0:
+                    raise ArchiveConversionError("No images found in CBZ archive.")
 
                 if status_callback:
-                    status_callback("Converting images to PDF...")
+                    status_callback("Reading images from CBZ...")
+
+                # Page bytes go straight from the archive to the PDF writer, no temp files
+                image_data = []
+                for i, img_name in enumerate(image_files):
+                    image_data.append(zip_file.read(img_name))
+                    if progress_callback:
+                        progress = extract_start + int(((i + 1) / total_images) * (extract_end - extract_start))
+                        progress_callback(progress, 100)
 
-                pil_images[0].save(
-                    output_path,
-                    save_all=True,
-                    append_images=pil_images[1:],
-                    format='PDF'
-                )
+            if status_callback:
+                status_callback("Converting images to PDF...")
 
-                if progress_callback:
-                    progress_callback(create_start, 100)  # 90% - PDF creation done
-                if status_callback:
-                    status_callback("Creating PDF file...")
-                if progress_callback:
-                    progress_callback(create_end, 100)  # 100% - Complete
-                if status_callback:
-                    status_callback("Cleaning up temporary files...")
+            if not self._write_pdf_with_img2pdf(image_data, output_path):
+                self._write_pdf_with_pil(image_data, output_path)
+
+            if progress_callback:
+                progress_callback(create_start, 100)  # 90% - PDF creation done
+            if status_callback:
+                status_callback("Creating PDF file...")
+            if progress_callback:
+                progress_callback(create_end, 100)  # 100% - Complete
         except Exception as e:
             error_msg = f"Failed to convert CBZ to PDF: {str(e)}"
             self.logger.error(error_msg)
             raise ArchiveConversionError(error_msg)
         
+    def _write_pdf_with_img2pdf(self, image_data: list, output_path: Path) -> bool:
+        """
+        Write a PDF by embedding the page images' compressed data unchanged,
+        without decoding them. Requires the optional img2pdf package.
+
+        Args:
+            image_data: Encoded page images as bytes, in page order.
+            output_path: Path of the PDF to write.
+
+        Returns:
+            bool: True if the PDF was written, False if img2pdf is unavailable
+            or cannot embed these images (e.g. PNGs with an alpha channel).
+        """
+        if img2pdf is None:
+            return False
+        try:
+            with open(output_path, 'wb') as pdf_file:
+                img2pdf.convert(image_data, outputstream=pdf_file)
+            return True
+        except Exception as e:
+            self.logger.info(f"img2pdf could not embed images, falling back to Pillow: {str(e)}")
+            return False
+
+    def _write_pdf_with_pil(self, image_data: list, output_path: Path):
+        """
+        Write a PDF by decoding every page image with Pillow and re-encoding it.
+
+        Args:
+            image_data: Encoded page images as bytes, in page order.
+            output_path: Path of the PDF to write.
+        """
+        pil_images = []
+        for data in image_data:
+            img = Image.open(io.BytesIO(data))
+            # Grayscale, CMYK and RGB pages are embedded as-is, saving a full-image copy
+            if img.mode not in PDF_NATIVE_MODES:
+                img = img.convert('RGB')
+            pil_images.append(img)
+
+        if not pil_images:
+            raise ArchiveConversionError("No valid images to convert to PDF.")
+
+        pil_images[0].save(
+            output_path,
+            save_all=True,
+            append_images=pil_images[1:],
+            format='PDF'
+        )
+
     def _create_zip_archive(
         self,
         source_path: Path,
         zip_path: Path,
         progress_callback: Optional[Callable[[int, int], None]] = None,
         start_progress: int = 0,
-        end_progress: int = 100
+        end_progress: int = 100,
+        compresslevel: int = DEFAULT_DEFLATE_LEVEL
     ):
         try:
-            all_files = list(source_path.rglob('*'))
-            files_to_archive = [f for f in all_files if f.is_file()]
-            total_files = len(files_to_archive)
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            # Without a progress callback the walk streams straight into the archive;
+            # the file list is only materialized when a total is needed
+            files_to_archive = iter_files(source_path)
+            total_files = 0
+            if progress_callback:
+                files_to_archive = list(files_to_archive)
+                total_files = len(files_to_archive)
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED, compresslevel=compresslevel) as zip_file:
                 for i, file_path in enumerate(files_to_archive):
-                    relative_path = file_path.relative_to(source_path)
-                    zip_file.write(file_path, relative_path)
+                    relative_path = os.path.relpath(file_path, source_path)
+                    zip_file.write(file_path, relative_path, compress_type=get_zip_compression(file_path))
                     if progress_callback and total_files > 0:
                         current_progress = start_progress + (
                             ((i + 1) / total_files) * (end_progress - start_progress)
@@ -1,4 +1,6 @@
-from PyQt6.QtCore import QObject, pyqtSignal
+import time
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 from capt_archive_converter.utils.logger import get_operation_logger
 from capt_archive_converter.processors.arc_conv_pdf_proc import PdfArchiveConverter
 from capt_archive_converter.processors.arc_conv_cb_proc import ArchiveArchiveConverter
@@ -14,6 +16,8 @@ class ConversionWorker(QObject):
     finished = pyqtSignal()
     status = pyqtSignal(str)  # New signal for intermediate status messages
 
+    MIN_PROGRESS_INTERVAL = 0.033  # Seconds between progress emits (~30 per second)
+
     def __init__(self, file_paths, target_format, delete_original):
         """
         Initialize the ConversionWorker.
@@ -30,17 +34,18 @@ class ConversionWorker(QObject):
         self.logger = get_operation_logger('conversion_worker')
         self.conversion_done = False  # Flag to control final progress emit
         self.last_progress_percent = -1  # Track last emitted progress to throttle updates
+        self.last_emit_time = 0.0  # time.monotonic() of the last progress emit
 
     def run(self):
         """
         Run the conversion process for all files.
         Uses the appropriate converter and emits results and finished signals.
         """
-        def status_callback(message):
-            self.status.emit(message)  # Define status callback as a function
+        status_callback = self.emit_status
         self.status_callback = status_callback  # Assign to self for later use
-        # Simplified and robust converter selection
-        if self.target_format == "pdf" or any(str(f).lower().endswith(".pdf") for f in self.file_paths):
+        # Simplified and robust converter selection; the batch is scanned only once
+        has_pdf = self.target_format == "pdf" or any(str(f).lower().endswith(".pdf") for f in self.file_paths)
+        if has_pdf:
             converter = PdfArchiveConverter(progress_callback=self.emit_progress, status_callback=status_callback)
             self.logger.info("Using PdfArchiveConverter")
         else:
@@ -48,7 +53,7 @@ class ConversionWorker(QObject):
             self.logger.info("Using ArchiveArchiveConverter")
 
         if self.status_callback:
-            self.status_callback("Initializing PDF converter..." if self.target_format == "pdf" or any(str(f).lower().endswith(".pdf") for f in self.file_paths) else "Initializing archive converter...")
+            self.status_callback("Initializing PDF converter..." if has_pdf else "Initializing archive converter...")
         self.logger.info(f"Target format: {self.target_format}, Files: {len(self.file_paths)}")
         if self.status_callback:
             self.status_callback(f"Starting conversion of {len(self.file_paths)} file(s)...")
@@ -77,12 +82,47 @@ class ConversionWorker(QObject):
     def emit_progress(self, current, total):
         """
         Emit progress signal for GUI updates, throttled to reduce emissions.
-        Only emit if progress has changed by at least 1%.
+        Only emit when the integer percentage changes, and at most once per
+        MIN_PROGRESS_INTERVAL; 100% is always emitted.
         """
-        if total > 0:
-            percent = int((current / total) * 100)
-            if abs(percent - self.last_progress_percent) >= 1 or percent == 100:  # Throttle to 1% changes or final 100%
-                self.last_progress_percent = percent
-                self.progress.emit(current, total)
-        else:
-            self.progress.emit(current, total)  # Emit for edge cases
+        percent = (current * 100) // total if total > 0 else 0
+        if percent == self.last_progress_percent:
+            return
+        now = time.monotonic()
+        if percent < 100 and now - self.last_emit_time < self.MIN_PROGRESS_INTERVAL:
+            return
+        self.last_progress_percent = percent
+        self.last_emit_time = now
+        self.progress.emit(current, total)
+
+    def emit_status(self, message):
+        """
+        Send a status message to the GUI straight away. Bursts are batched on
+        the GUI side: ProgressWidget buffers messages arriving faster than it
+        can usefully repaint and appends them on its flush timer.
+
+        Args:
+            message (str): Status message.
+        """
+        self.status.emit(message)
+
+
+class ConversionRunnable(QRunnable):
+    """
+    Runs a ConversionWorker on a QThreadPool thread.
+    The worker stays on the GUI thread, so its signals are delivered there as queued calls.
+    """
+
+    def __init__(self, worker):
+        """
+        Initialize the ConversionRunnable.
+
+        Args:
+            worker (ConversionWorker): The worker whose run() is executed on the pool thread.
+        """
+        super().__init__()
+        self.worker = worker
+
+    def run(self):
+        """Run the wrapped worker's conversion."""
+        self.worker.run()
@@ -1,12 +1,66 @@
 import zipfile
 import rarfile
+import shutil
 import subprocess
+import threading
 import os  # Add import for os.scandir
+from functools import partial
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterator, Union
+
+try:
+    import libarchive  # Optional: libarchive-c reads RAR in-process, no unrar subprocess
+except ImportError:
+    libarchive = None
 
 CONVERTED_EXTENSIONS = ('.cbz', '.cbr', '.pdf')
 
+# Magic numbers of image formats that are already compressed (JPEG, PNG, GIF)
+COMPRESSED_IMAGE_SIGNATURES = (b'\xff\xd8\xff', b'\x89PNG', b'GIF8')
+# Suffixes trusted to be compressed images without reading the file header
+COMPRESSED_IMAGE_SUFFIXES = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+# zlib level for files that do get deflated: level 1 is several times faster
+# than the default (6) and only slightly larger on metadata-sized files
+DEFAULT_DEFLATE_LEVEL = 1
+# Runs the external rar tool; tests stub this name instead of the global subprocess.run
+_run = subprocess.run
+
+
+def is_compressed_image(header: bytes) -> bool:
+    """
+    Check whether file header bytes belong to an already-compressed image.
+
+    Args:
+        header (bytes): At least the first 12 bytes of the file.
+
+    Returns:
+        bool: True for JPEG, PNG, GIF and WebP data.
+    """
+    if header.startswith(COMPRESSED_IMAGE_SIGNATURES):
+        return True
+    return header[:4] == b'RIFF' and header[8:12] == b'WEBP'
+
+
+def get_zip_compression(file_path: Union[str, Path]) -> int:
+    """
+    Choose the ZIP compression method for a file about to be archived.
+
+    Compressed images gain almost nothing from deflate, so they are stored;
+    anything else (e.g. ComicInfo.xml) is deflated. Known image suffixes are
+    decided without opening the file; other files have their header sniffed.
+
+    Args:
+        file_path (Union[str, Path]): File to inspect.
+
+    Returns:
+        int: zipfile.ZIP_STORED or zipfile.ZIP_DEFLATED.
+    """
+    if os.path.splitext(file_path)[1].lower() in COMPRESSED_IMAGE_SUFFIXES:
+        return zipfile.ZIP_STORED
+    with open(file_path, 'rb') as f:
+        header = f.read(12)
+    return zipfile.ZIP_STORED if is_compressed_image(header) else zipfile.ZIP_DEFLATED
+
 
 def extract_rar_archive(
     rar_path: Path,
@@ -17,6 +71,7 @@ def extract_rar_archive(
 ):
     """
     Extract a RAR archive to a specified directory with optional progress tracking.
+    Uses libarchive-c in-process when installed, otherwise rarfile.
 
     Args:
         rar_path (Path): Path to the RAR file to extract.
@@ -29,6 +84,9 @@ def extract_rar_archive(
         RuntimeError: If extraction fails.
     """
     try:
+        if libarchive is not None:
+            _extract_rar_with_libarchive(rar_path, extract_path, progress_callback)
+            return
         with rarfile.RarFile(str(rar_path), 'r') as rar_file:
             file_list = rar_file.namelist()
             total_files = len(file_list)
@@ -40,6 +98,49 @@ def extract_rar_archive(
         raise RuntimeError(f"Failed to extract RAR archive: {str(e)}")
     
 
+def _safe_member_path(extract_path: Path, member_name: str) -> Path:
+    """
+    Resolve an archive member name under extract_path, rejecting paths that escape it.
+    """
+    root = extract_path.resolve()
+    target = (root / member_name).resolve()
+    if root != target and root not in target.parents:
+        raise RuntimeError(f"Unsafe path in archive: {member_name}")
+    return target
+
+
+def _count_libarchive_files(archive_path: Path) -> int:
+    """
+    Count the file entries in an archive by reading headers only.
+    """
+    with libarchive.file_reader(str(archive_path)) as archive:
+        return sum(1 for entry in archive if entry.isfile)
+
+
+def _extract_rar_with_libarchive(
+    rar_path: Path,
+    extract_path: Path,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+):
+    """
+    Extract a RAR archive in-process using libarchive-c.
+    """
+    total_files = _count_libarchive_files(rar_path) if progress_callback else 0
+    extracted = 0
+    with libarchive.file_reader(str(rar_path)) as archive:
+        for entry in archive:
+            if not entry.isfile:
+                continue
+            target = _safe_member_path(extract_path, entry.pathname)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(target, 'wb') as out_file:
+                for block in entry.get_blocks():
+                    out_file.write(block)
+            extracted += 1
+            if progress_callback and total_files > 0:
+                progress_callback(extracted, total_files)
+
+
 def extract_zip_archive(
     zip_path: Path,
     extract_path: Path,
@@ -72,15 +173,41 @@ def extract_zip_archive(
         raise RuntimeError(f"Failed to extract ZIP archive: {str(e)}")
     
 
+def iter_files(root: Union[str, Path]) -> Iterator[str]:
+    """
+    Recursively yield the paths of all files under a directory.
+
+    Uses os.scandir, whose entries answer is_dir() from the directory listing
+    itself, so no extra stat call is made per file. Like os.walk, symlinked
+    directories are not followed; symlinked files are included, while
+    sockets, FIFOs and other special files are skipped.
+
+    Args:
+        root (Union[str, Path]): Directory to walk.
+
+    Yields:
+        str: Path of each file found.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path)
+            elif entry.is_file():
+                yield entry.path
+
+
 def create_zip_archive(
     source_path: Path,
     zip_path: Path,
     progress_callback: Optional[Callable[[int, int], None]] = None,
     start_progress: int = 0,
-    end_progress: int = 100
+    end_progress: int = 100,
+    compresslevel: int = DEFAULT_DEFLATE_LEVEL,
+    compression: Optional[int] = None
 ):
     """
     Create a ZIP archive from a source directory with optional progress tracking.
+    By default JPEG/PNG/GIF/WebP pages are stored as-is and other files are deflated.
 
     Args:
         source_path (Path): Directory to archive.
@@ -88,6 +215,9 @@ def create_zip_archive(
         progress_callback (Optional[Callable[[int, int], None]]): Callback for progress updates.
         start_progress (int): Starting progress value.
         end_progress (int): Ending progress value.
+        compresslevel (int): zlib level (1-9) for deflated files.
+        compression (Optional[int]): zipfile method (e.g. zipfile.ZIP_STORED) used
+            for every file; None picks one per file with get_zip_compression.
 
     Raises:
         RuntimeError: If archive creation fails.
@@ -95,17 +225,18 @@ def create_zip_archive(
     if not source_path.exists() or not source_path.is_dir():
         raise RuntimeError(f"Source directory does not exist: {source_path}")
     try:
-        # Use os.scandir for faster traversal
-        all_files = []
-        for root, dirs, files in os.walk(source_path):
-            for file in files:
-                all_files.append(Path(root) / file)
-        files_to_archive = all_files
-        total_files = len(files_to_archive)
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        # Without a progress callback the walk streams straight into the archive;
+        # the file list is only materialized when a total is needed
+        files_to_archive = iter_files(source_path)
+        total_files = 0
+        if progress_callback:
+            files_to_archive = list(files_to_archive)
+            total_files = len(files_to_archive)
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED, compresslevel=compresslevel) as zip_file:
             for i, file_path in enumerate(files_to_archive):
-                relative_path = file_path.relative_to(source_path)
-                zip_file.write(file_path, relative_path)
+                relative_path = os.path.relpath(file_path, source_path)
+                compress_type = compression if compression is not None else get_zip_compression(file_path)
+                zip_file.write(file_path, relative_path, compress_type=compress_type)
                 if progress_callback and total_files > 0:
                     current_progress = start_progress + (
                         ((i + 1) / total_files) * (end_progress - start_progress)
@@ -115,6 +246,78 @@ def create_zip_archive(
         raise RuntimeError(f"Failed to create ZIP archive: {str(e)}")
     
 
+def stream_rar_to_zip_archive(
+    rar_path: Path,
+    zip_path: Path,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    start_progress: int = 0,
+    end_progress: int = 100
+):
+    """
+    Copy every file in a RAR archive straight into a new ZIP archive.
+
+    Entries are streamed member-to-member, so nothing is written to a
+    temporary directory. Pages are stored without recompression.
+    Uses libarchive-c in-process when installed, otherwise rarfile.
+
+    Args:
+        rar_path (Path): Path to the source RAR file.
+        zip_path (Path): Path for the output ZIP file.
+        progress_callback (Optional[Callable[[int, int], None]]): Callback for progress updates.
+        start_progress (int): Starting progress value.
+        end_progress (int): Ending progress value.
+
+    Raises:
+        RuntimeError: If reading the RAR or writing the ZIP fails.
+    """
+    try:
+        if libarchive is not None:
+            _stream_rar_to_zip_with_libarchive(rar_path, zip_path, progress_callback, start_progress, end_progress)
+            return
+        with rarfile.RarFile(str(rar_path), 'r') as rar_file, \
+                zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zip_file:
+            members = [info for info in rar_file.infolist() if not info.is_dir()]
+            total_files = len(members)
+            for i, info in enumerate(members):
+                with rar_file.open(info) as src, zip_file.open(info.filename, 'w', force_zip64=True) as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+                if progress_callback and total_files > 0:
+                    current_progress = start_progress + (
+                        ((i + 1) / total_files) * (end_progress - start_progress)
+                    )
+                    progress_callback(int(current_progress), 100)
+    except Exception as e:
+        raise RuntimeError(f"Failed to convert RAR archive to ZIP: {str(e)}")
+
+
+def _stream_rar_to_zip_with_libarchive(
+    rar_path: Path,
+    zip_path: Path,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    start_progress: int = 0,
+    end_progress: int = 100
+):
+    """
+    Copy RAR entries into a ZIP archive block by block using libarchive-c.
+    """
+    total_files = _count_libarchive_files(rar_path) if progress_callback else 0
+    written = 0
+    with libarchive.file_reader(str(rar_path)) as archive, \
+            zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zip_file:
+        for entry in archive:
+            if not entry.isfile:
+                continue
+            with zip_file.open(entry.pathname, 'w', force_zip64=True) as dst:
+                for block in entry.get_blocks():
+                    dst.write(block)
+            written += 1
+            if progress_callback and total_files > 0:
+                current_progress = start_progress + (
+                    (written / total_files) * (end_progress - start_progress)
+                )
+                progress_callback(int(current_progress), 100)
+
+
 def create_rar_archive(
     source_path: Path,
     rar_path: Path,
@@ -137,21 +340,17 @@ def create_rar_archive(
     """
     try:
         try:
-            subprocess.run(['rar'], capture_output=True, check=False)
+            _run(['rar'], capture_output=True, check=False)
         except FileNotFoundError:
             raise RuntimeError(
                 "RAR command-line tool not found. Install Rarfile or rar package to create CBR files."
             )
 
-        # Use os.scandir for faster traversal
-        all_files = []
-        for root, dirs, files in os.walk(source_path):
-            for file in files:
-                all_files.append(Path(root) / file)
-        files_to_archive = all_files
-        total_files = len(files_to_archive)
-
+        # rar recurses into source_path itself; the walk only supplies the
+        # file count for progress reports, so it is skipped without a callback
+        total_files = 0
         if progress_callback:
+            total_files = sum(1 for _ in iter_files(source_path))
             progress_callback(start_progress + 10, total_files)
 
         cmd = [
@@ -159,7 +358,7 @@ def create_rar_archive(
             str(rar_path),
             str(source_path / '*')
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = _run(cmd, capture_output=True, text=True)
         if result.returncode != 0:
             raise RuntimeError(f"RAR creation failed: {result.stderr}")
 
@@ -171,6 +370,137 @@ def create_rar_archive(
         raise RuntimeError(f"Failed to create RAR archive: {str(e)}")
 
 
+def outputs_are_independent(file_paths: list, target_format: str) -> bool:
+    """
+    Check that no file's converted output path collides with another input or
+    output, so the files can safely be converted concurrently.
+
+    Args:
+        file_paths: List of full file paths to convert.
+        target_format: Target suffix without the dot (e.g. 'cbz').
+
+    Returns:
+        bool: True if every input and output path is distinct.
+    """
+    inputs = {Path(f) for f in file_paths}
+    outputs = {Path(f).with_suffix(f'.{target_format.lower()}') for f in file_paths}
+    return len(inputs) == len(outputs) == len(file_paths) and not inputs & outputs
+
+
+class PerFileProgressCallback:
+    """
+    Per-file progress callback that shows 0-100% for each file.
+    Ensures the bar resets for each file and emits final 100% only for the last file.
+    Repeated values are dropped so each percentage is emitted once.
+    """
+    __slots__ = ('progress_callback', 'is_last_file', 'last_percent')
+
+    def __init__(
+        self,
+        progress_callback: Optional[Callable[[int, int], None]],
+        is_last_file: bool = False
+    ):
+        """
+        Args:
+            progress_callback: The base progress callback to emit to.
+            is_last_file: True if this is the last file, to emit final 100%.
+        """
+        self.progress_callback = progress_callback
+        self.is_last_file = is_last_file
+        self.last_percent = -1
+
+    def __call__(self, current: int, total: int):
+        if self.progress_callback is None:
+            return
+        if total > 0:
+            percent = min(100, max(0, int((current / total) * 100)))
+        else:
+            percent = 0
+        # For non-last files, cap at 99% to avoid multiple 100%
+        if not self.is_last_file and percent == 100:
+            percent = 99
+        if percent == self.last_percent:
+            return
+        self.last_percent = percent
+        self.progress_callback(percent, 100)
+
+
+class PerFileStatusCallback:
+    """
+    Per-file status callback that prefixes messages with "File <n>/<total>: ".
+    """
+    __slots__ = ('status_callback', 'prefix')
+
+    def __init__(
+        self,
+        status_callback: Optional[Callable[[str], None]],
+        file_index: int,
+        total_files: int
+    ):
+        """
+        Args:
+            status_callback: The base status callback to emit to.
+            file_index: Index of the current file (0-based).
+            total_files: Total number of files.
+        """
+        self.status_callback = status_callback
+        # Built once per file rather than on every message
+        self.prefix = f"File {file_index + 1}/{total_files}: "
+
+    def __call__(self, message: str):
+        if self.status_callback is None:
+            return
+        self.status_callback(self.prefix + message)
+
+
+class BatchProgressCallback:
+    """
+    Combines per-file progress from concurrently converted files into one
+    overall 0-100% value. Safe to call from multiple threads.
+    """
+    __slots__ = ('progress_callback', 'file_percents', 'last_percent', 'lock')
+
+    def __init__(self, progress_callback: Optional[Callable[[int, int], None]], total_files: int):
+        """
+        Args:
+            progress_callback: The base progress callback to emit to.
+            total_files: Total number of files in the batch.
+        """
+        self.progress_callback = progress_callback
+        self.file_percents = [0] * total_files
+        self.last_percent = -1
+        self.lock = threading.Lock()
+
+    def for_file(self, file_index: int) -> Callable[[int, int], None]:
+        """
+        Return a progress callback bound to one file of the batch.
+
+        Args:
+            file_index: Index of the file (0-based).
+        """
+        return partial(self.update, file_index)
+
+    def update(self, file_index: int, current: int, total: int):
+        """
+        Record one file's progress and emit the overall batch percentage.
+
+        Args:
+            file_index: Index of the file (0-based).
+            current: Current progress value for the file.
+            total: Total value for the file.
+        """
+        if self.progress_callback is None:
+            return
+        percent = min(100, max(0, int((current / total) * 100))) if total > 0 else 0
+        with self.lock:
+            self.file_percents[file_index] = percent
+            overall = sum(self.file_percents) // len(self.file_percents)
+            if overall == self.last_percent:
+                return
+            self.last_percent = overall
+            self.progress_callback(overall, 100)
+
+
 def create_per_file_progress_callback(
     progress_callback: Optional[Callable[[int, int], None]],
     file_index: int,
@@ -190,14 +520,4 @@ def create_per_file_progress_callback(
     Returns:
         A callback function for per-file progress updates.
     """
-    def callback(current: int, total: int):
-        if progress_callback:
-            if total > 0:
-                percent = min(100, max(0, int((current / total) * 100)))
-            else:
-                percent = 0
-            # For non-last files, cap at 99% to avoid multiple 100%
-            if not is_last_file and percent == 100:
-                percent = 99
-            progress_callback(percent, 100)
-    return callback
+    return PerFileProgressCallback(progress_callback, is_last_file)
@@ -10,10 +10,20 @@ Provides core functionality for comic archive processing including:
 - Error handling and recovery
 """
 
+import os
+import threading
 import zipfile
 import rarfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List, Iterator
+
+try:
+    import fitz  # PyMuPDF; only needed to validate PDFs
+except ImportError:
+    fitz = None
 
 from capt_archive_converter.utils.logger import get_operation_logger
 
@@ -26,12 +36,88 @@ class ArchiveConversionError(Exception):
     pass
 
 
+# Leading bytes identifying each format; one 8-byte read classifies most files
+# without the central-directory seeks of zipfile.is_zipfile / rarfile.is_rarfile
+FORMAT_SIGNATURES = (
+    (b'PK\x03\x04', 'CBZ'),
+    (b'PK\x05\x06', 'CBZ'),  # empty ZIP
+    (b'Rar!\x1a\x07', 'CBR'),  # RAR 4 and 5
+    (b'%PDF', 'PDF'),
+)
+
+
+def _read_header(path: Path, size: int = 8) -> bytes:
+    """
+    Read the first bytes of a file. Uses a single os.pread on POSIX, skipping
+    Python's buffered file object.
+
+    Args:
+        path (Path): File to read.
+        size (int): Number of bytes to read.
+
+    Returns:
+        bytes: Up to size bytes from the start of the file.
+    """
+    if hasattr(os, 'pread'):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            return os.pread(fd, size, 0)
+        finally:
+            os.close(fd)
+    with open(path, 'rb') as f:
+        return f.read(size)
+
+
+def _detect_format(archive_path: Path, strict: bool = False) -> Optional[str]:
+    """
+    Probe a file's extension and magic bytes for its archive format.
+
+    The suffix is not trusted for CBZ/CBR, since comics are often saved with
+    the wrong one. With strict, files whose header matches no known
+    signature (e.g. ZIPs with prepended data) also get the full stdlib probes.
+
+    Args:
+        archive_path (Path): Path to the file.
+        strict (bool): Fall back to zipfile.is_zipfile / rarfile.is_rarfile.
+
+    Returns:
+        str: 'CBZ', 'CBR', 'PDF', or None if format cannot be determined.
+    """
+    if archive_path.suffix.lower() == '.pdf':
+        return 'PDF'
+    try:
+        header = _read_header(archive_path)
+    except OSError:
+        return None
+    for signature, format_type in FORMAT_SIGNATURES:
+        if header.startswith(signature):
+            return format_type
+    if not strict:
+        return None
+    if zipfile.is_zipfile(archive_path):
+        return 'CBZ'
+    if rarfile.is_rarfile(str(archive_path)):
+        return 'CBR'
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _detect_format_cached(path_str: str, mtime_ns: int, size: int, strict: bool = False) -> Optional[str]:
+    """
+    Memoised _detect_format, keyed on the file's mtime and size so edits invalidate it.
+    """
+    return _detect_format(Path(path_str), strict)
+
+
 class ArchiveConverter:
     """
     Handles conversion and validation between CBR, CBZ, and PDF-to-CBZ archive formats.
     Provides format detection, archive validation, and utility methods for comic archives.
     """
 
+    # Most validation results kept in memory; the oldest are dropped first
+    VALIDATE_CACHE_SIZE = 8192
+
     def __init__(self):
         """
         Initialize the archive converter with logging and supported image extensions.
@@ -40,32 +126,43 @@ class ArchiveConverter:
         self.supported_image_extensions = {
             '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'
         }
+        # Same extensions as a tuple, for str.endswith on member names
+        self._ext_tuple = tuple(sorted(self.supported_image_extensions))
+        self._meta_name = 'comicinfo.xml'
+        # (path, mtime_ns, size) -> validation result, oldest first
+        self._validate_cache = OrderedDict()
+        self._validate_cache_lock = threading.Lock()  # validate_many runs on several threads
 
-    def detect_archive_format(self, archive_path: Path) -> Optional[str]:
+    def detect_archive_format(self, archive_path: Path, strict: bool = False) -> Optional[str]:
         """
-        Detect the format of an archive file or PDF.
+        Detect the format of an archive file or PDF from its header bytes.
+        Results are cached per path until the file's mtime or size changes.
 
         Args:
             archive_path (Path): Path to the file.
+            strict (bool): Also run the slower stdlib ZIP/RAR probes on files
+                with an unrecognised header.
 
         Returns:
             str: 'CBZ', 'CBR', 'PDF', or None if format cannot be determined.
         """
         try:
-            if archive_path.suffix.lower() == '.pdf':
-                return 'PDF'
-            if zipfile.is_zipfile(archive_path):
-                return 'CBZ'
-            if rarfile.is_rarfile(str(archive_path)):
-                return 'CBR'
-            return None
+            try:
+                stat = archive_path.stat()
+            except OSError:
+                return _detect_format(archive_path, strict)
+            return _detect_format_cached(str(archive_path), stat.st_mtime_ns, stat.st_size, strict)
         except Exception as e:
             self.logger.error(f"Error detecting format for {archive_path}: {str(e)}")
             return None
 
-    def validate_comic_archive(self, archive_path: Path) -> Tuple[bool, str, Dict[str, Any]]:
+    def validate_comic_archive(
+        self, archive_path: Path
+    ) -> Tuple[bool, str, Dict[str, Any]]:
         """
         Validate if an archive is a proper comic archive or PDF.
+        Results are cached per path until the file's mtime or size changes;
+        each call gets its own copy of the details dict.
 
         Args:
             archive_path (Path): Path to the archive or PDF file.
@@ -73,15 +170,38 @@ class ArchiveConverter:
         Returns:
             Tuple[bool, str, dict]: (is_valid, format, details_dict)
         """
+        try:
+            stat = archive_path.stat()
+        except OSError:
+            return self._validate_uncached(archive_path)
+        key = (str(archive_path), stat.st_mtime_ns, stat.st_size)
+        with self._validate_cache_lock:
+            cached = self._validate_cache.get(key)
+            if cached is not None:
+                self._validate_cache.move_to_end(key)
+        if cached is None:
+            cached = self._validate_uncached(archive_path)
+            with self._validate_cache_lock:
+                self._validate_cache[key] = cached
+                if len(self._validate_cache) > self.VALIDATE_CACHE_SIZE:
+                    self._validate_cache.popitem(last=False)
+        is_valid, format_type, details = cached
+        return is_valid, format_type, dict(details)
+
+    def _validate_uncached(
+        self, archive_path: Path
+    ) -> Tuple[bool, str, Dict[str, Any]]:
+        """
+        Validate an archive without consulting the cache; see validate_comic_archive.
+        """
         details = {
             'image_count': 0,
             'has_metadata': False,
             'has_folders': False,
-            'image_files': [],
             'total_size': 0
         }
 
-        format_type = self.detect_archive_format(archive_path)
+        format_type = self.detect_archive_format(archive_path, strict=True)
         if not format_type:
             return False, 'UNKNOWN', details
 
@@ -98,6 +218,96 @@ class ArchiveConverter:
 
         return False, format_type, details
 
+    def validate_many(
+        self, paths: List[Path], max_workers: int = 8
+    ) -> Dict[Path, Tuple[bool, str, Dict[str, Any]]]:
+        """
+        Validate many archives at once. ZIP/RAR validation is dominated by
+        header reads that release the GIL, so archives are checked on a
+        thread pool. PDFs are checked in the calling thread, because PyMuPDF
+        must not be used from several threads.
+
+        Args:
+            paths (List[Path]): Archives or PDFs to validate.
+            max_workers (int): Upper bound on validation threads.
+
+        Returns:
+            dict: Maps each path to its validate_comic_archive result.
+        """
+        pdf_paths, archive_paths = [], []
+        for p in paths:
+            (pdf_paths if self.detect_archive_format(p) == 'PDF' else archive_paths).append(p)
+        results = {}
+        if archive_paths:
+            workers = min(max_workers, (os.cpu_count() or 1) * 2, len(archive_paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results.update(zip(archive_paths, executor.map(self.validate_comic_archive, archive_paths)))
+        for p in pdf_paths:
+            results[p] = self.validate_comic_archive(p)
+        # Report in the caller's order
+        return {p: results[p] for p in paths}
+
+    def iter_image_names(self, archive_path: Path) -> Iterator[str]:
+        """
+        Yield the names of a CBZ/CBR's image members, reading them from a fresh
+        open of the archive rather than holding them all in memory.
+
+        Args:
+            archive_path (Path): Path to the archive.
+
+        Yields:
+            str: Each image member name, in archive order.
+
+        Raises:
+            ArchiveConversionError: If the file is not a CBZ or CBR.
+        """
+        format_type = self.detect_archive_format(archive_path, strict=True)
+        if format_type == 'CBZ':
+            opener = zipfile.ZipFile(archive_path, 'r')
+        elif format_type == 'CBR':
+            opener = rarfile.RarFile(str(archive_path), 'r')
+        else:
+            raise ArchiveConversionError(f"Not a CBZ or CBR archive: {archive_path}")
+        with opener as archive:
+            for info in archive.infolist():
+                if info.filename.lower().endswith(self._ext_tuple):
+                    yield info.filename
+
+    def quick_has_metadata(self, archive_path: Path) -> bool:
+        """
+        Check whether a CBZ/CBR contains a ComicInfo.xml, stopping at the first
+        match instead of tallying every entry like validate_comic_archive.
+
+        Args:
+            archive_path (Path): Path to the archive.
+
+        Returns:
+            bool: True if a ComicInfo.xml entry exists; False otherwise,
+            including for PDFs and unreadable files.
+        """
+        format_type = self.detect_archive_format(archive_path, strict=True)
+        try:
+            if format_type == 'CBZ':
+                with zipfile.ZipFile(archive_path, 'r') as zip_file:
+                    return self._has_metadata_entry(zip_file.infolist())
+            if format_type == 'CBR':
+                with rarfile.RarFile(str(archive_path), 'r') as rar_file:
+                    return self._has_metadata_entry(rar_file.infolist())
+        except Exception as e:
+            self.logger.error(f"Error reading archive {archive_path}: {str(e)}")
+        return False
+
+    def _has_metadata_entry(self, infos) -> bool:
+        """
+        Return True on the first ZipInfo/RarInfo named ComicInfo.xml, in any folder.
+        """
+        meta_suffix = '/' + self._meta_name
+        for info in infos:
+            name_lower = info.filename.lower()
+            if name_lower == self._meta_name or name_lower.endswith(meta_suffix):
+                return True
+        return False
+
     def _validate_pdf_file(self, archive_path: Path, details: Dict[str, Any]) -> Tuple[bool, str, Dict[str, Any]]:
         """
         Validate a PDF file for comic archive suitability.
@@ -109,19 +319,53 @@ class ArchiveConverter:
         Returns:
             Tuple[bool, str, dict]: (is_valid, 'PDF', details_dict)
         """
+        if fitz is None:
+            self.logger.error(f"Cannot validate PDF {archive_path}: PyMuPDF is not installed")
+            return False, 'PDF', details
         try:
-            import fitz  # PyMuPDF
-            doc = fitz.open(str(archive_path))
-            details['image_count'] = doc.page_count
+            # page_count comes from the page tree; no page is loaded or rendered
+            with fitz.open(str(archive_path)) as doc:
+                details['image_count'] = doc.page_count
             details['total_size'] = archive_path.stat().st_size
-            doc.close()
             is_valid = details['image_count'] > 0
             return is_valid, 'PDF', details
         except Exception as e:
             self.logger.error(f"Error validating PDF {archive_path}: {str(e)}")
             return False, 'PDF', details
 
-    def _validate_zip_archive(self, archive_path: Path, details: Dict[str, Any]) -> Tuple[bool, str, Dict[str, Any]]:
+    def _scan_members(self, infos, details: Dict[str, Any]):
+        """
+        Tally image members, metadata and folders from an archive's entries in
+        a single pass, reading name and size straight off each info object.
+
+        Args:
+            infos: ZipInfo or RarInfo objects from infolist().
+            details (dict): Details dictionary to populate.
+        """
+        ext_tuple = self._ext_tuple
+        meta_name = self._meta_name
+        meta_suffix = '/' + meta_name
+        image_count = 0
+        total_size = 0
+        has_folders = False
+        for info in infos:
+            file_name = info.filename
+            name_lower = file_name.lower()
+            if name_lower == meta_name or name_lower.endswith(meta_suffix):
+                details['has_metadata'] = True
+            # ZIP names always use '/', and rarfile normalises RAR names to it
+            if not has_folders and '/' in file_name:
+                has_folders = True
+            if name_lower.endswith(ext_tuple):
+                image_count += 1
+                total_size += info.file_size
+        details['image_count'] += image_count
+        details['total_size'] += total_size
+        details['has_folders'] = details['has_folders'] or has_folders
+
+    def _validate_zip_archive(
+        self, archive_path: Path, details: Dict[str, Any]
+    ) -> Tuple[bool, str, Dict[str, Any]]:
         """
         Validate a ZIP-based comic archive (CBZ).
 
@@ -134,28 +378,16 @@ class ArchiveConverter:
         """
         try:
             with zipfile.ZipFile(archive_path, 'r') as zip_file:
-                file_list = zip_file.namelist()
-                for file_name in file_list:
-                    file_path = Path(file_name)
-                    if file_path.name.lower() == 'comicinfo.xml':
-                        details['has_metadata'] = True
-                    if len(file_path.parts) > 1:
-                        details['has_folders'] = True
-                    if file_path.suffix.lower() in self.supported_image_extensions:
-                        details['image_count'] += 1
-                        details['image_files'].append(file_name)
-                        try:
-                            file_info = zip_file.getinfo(file_name)
-                            details['total_size'] += file_info.file_size
-                        except Exception:
-                            pass
+                self._scan_members(zip_file.infolist(), details)
                 is_valid = details['image_count'] > 0
                 return is_valid, 'CBZ', details
         except Exception as e:
             self.logger.error(f"Error validating ZIP archive {archive_path}: {str(e)}")
             return False, 'CBZ', details
 
-    def _validate_rar_archive(self, archive_path: Path, details: Dict[str, Any]) -> Tuple[bool, str, Dict[str, Any]]:
+    def _validate_rar_archive(
+        self, archive_path: Path, details: Dict[str, Any]
+    ) -> Tuple[bool, str, Dict[str, Any]]:
         """
         Validate a RAR-based comic archive (CBR).
 
@@ -168,21 +400,7 @@ class ArchiveConverter:
         """
         try:
             with rarfile.RarFile(str(archive_path), 'r') as rar_file:
-                file_list = rar_file.namelist()
-                for file_name in file_list:
-                    file_path = Path(file_name)
-                    if file_path.name.lower() == 'comicinfo.xml':
-                        details['has_metadata'] = True
-                    if len(file_path.parts) > 1:
-                        details['has_folders'] = True
-                    if file_path.suffix.lower() in self.supported_image_extensions:
-                        details['image_count'] += 1
-                        details['image_files'].append(file_name)
-                        try:
-                            file_info = rar_file.getinfo(file_name)
-                            details['total_size'] += file_info.file_size
-                        except Exception:
-                            pass
+                self._scan_members(rar_file.infolist(), details)
                 is_valid = details['image_count'] > 0
                 return is_valid, 'CBR', details
         except Exception as e:
@@ -190,11 +408,25 @@ class ArchiveConverter:
             return False, 'CBR', details
 
 
+_shared_converter: Optional[ArchiveConverter] = None
+# Guards the first construction, so concurrent callers share one instance (and one validation cache)
+_shared_converter_lock = threading.Lock()
+
+
 def get_archive_converter() -> ArchiveConverter:
     """
-    Factory function to get an ArchiveConverter instance.
+    Factory function to get the process-wide ArchiveConverter instance.
+
+    ArchiveConverter holds no per-call state: each detection or validation
+    opens its own file handles, so one instance is safe to share between
+    threads (see validate_many).
 
     Returns:
-        ArchiveConverter: A new ArchiveConverter object.
+        ArchiveConverter: The shared ArchiveConverter object.
     """
-    return ArchiveConverter()
+    global _shared_converter
+    if _shared_converter is None:
+        with _shared_converter_lock:
+            if _shared_converter is None:
+                _shared_converter = ArchiveConverter()
+    return _shared_converter
@@ -10,11 +10,102 @@ Features:
 - Console output with appropriate formatting
 - Development vs production log levels
 - Automatic log directory creation
+- Log files written by background listener threads, off the converter's hot path
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
+
+# Log directories already created by this process, so repeat calls skip the mkdir syscall
+_ready_log_dirs = set()
+
+
+def _ensure_log_dir(log_dir: Path) -> Path:
+    """
+    Create the log directory the first time it is needed in this process.
+
+    Args:
+        log_dir: Directory that will hold the log files.
+
+    Returns:
+        The same log directory.
+    """
+    if log_dir not in _ready_log_dirs:
+        log_dir.mkdir(exist_ok=True)
+        _ready_log_dirs.add(log_dir)
+    return log_dir
+
+
+# (logger, queue_handler, listener) for every file handler moved behind a queue
+_queued_handlers = []
+# Whether shutdown_logging is registered to run at interpreter exit
+_atexit_registered = False
+
+
+def _attach_queued(logger: logging.Logger, handler: logging.Handler):
+    """
+    Attach a handler to a logger through a queue, so logging calls only
+    enqueue the record and a listener thread does the file write. The first
+    listener registers shutdown_logging with atexit: listener threads are
+    daemons, so records still queued at exit would otherwise be lost.
+
+    Args:
+        logger: Logger to attach to.
+        handler: The (file) handler that performs the actual output.
+    """
+    global _atexit_registered
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    if not _atexit_registered:
+        atexit.register(shutdown_logging)
+        _atexit_registered = True
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    logger.addHandler(queue_handler)
+    _queued_handlers.append((logger, queue_handler, listener))
+
+
+def _detach_queued(logger: Optional[logging.Logger] = None):
+    """
+    Stop queue listeners, writing out any records still queued, and remove
+    their queue handlers. Only those of the given logger if one is passed.
+
+    Args:
+        logger: Logger whose queued handlers to detach, or None for all.
+    """
+    remaining = []
+    for entry in _queued_handlers:
+        owner, queue_handler, listener = entry
+        if logger is not None and owner is not logger:
+            remaining.append(entry)
+            continue
+        listener.stop()  # Drains the queue before returning
+        owner.removeHandler(queue_handler)
+        for handler in listener.handlers:
+            handler.close()
+    _queued_handlers[:] = remaining
+
+
+def flush_logging():
+    """
+    Block until the background writers have written every record queued so
+    far. Unlike shutdown_logging, the listeners keep running.
+    """
+    for _, _, listener in list(_queued_handlers):
+        listener.queue.join()
+
+
+def shutdown_logging():
+    """
+    Flush and stop all background log writers. Call on application exit;
+    loggers requested afterwards are set up afresh.
+    """
+    _detach_queued()
 
 
 def setup_logging(log_level=logging.INFO):
@@ -28,14 +119,14 @@ def setup_logging(log_level=logging.INFO):
         log_level: Logging level (default: INFO for users, DEBUG for development)
     """
     # Create logs directory if it doesn't exist
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
+    log_dir = _ensure_log_dir(Path("logs"))
 
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
     # Clear any existing handlers
+    _detach_queued(root_logger)
     root_logger.handlers.clear()
 
     # Console handler with user-friendly format
@@ -56,7 +147,7 @@ def setup_logging(log_level=logging.INFO):
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_format)
-    root_logger.addHandler(file_handler)
+    _attach_queued(root_logger, file_handler)
 
     logging.info("C.A.P.T - logging initialised")
     logging.info(f"Log files location: {log_dir.absolute()}")
@@ -79,15 +170,14 @@ def get_operation_logger(operation_name: str) -> logging.Logger:
         logger = get_operation_logger('convert')
         logger.info("Starting CBR to CBZ conversion")
     """
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-
     # Create operation-specific logger
     logger_name = f"comic_toolkit.{operation_name}"
     logger = logging.getLogger(logger_name)
 
-    # Avoid duplicate handlers if logger already exists
+    # Avoid duplicate handlers if logger already exists; only a new logger
+    # needs the log directory, so repeat calls touch no files at all
     if not logger.handlers:
+        log_dir = _ensure_log_dir(Path("logs"))
         # Operation-specific log file
         log_file = log_dir / f"{operation_name}_operations.log"
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
@@ -99,7 +189,7 @@ def get_operation_logger(operation_name: str) -> logging.Logger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        _attach_queued(logger, file_handler)
 
         # Also log to console (will inherit from root logger)
         logger.setLevel(logging.INFO)
@@ -9,11 +9,15 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QListWidget, QLabel, QFileDialog, QListWidgetItem
 )
 
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, QPoint, QTimer
 from PyQt6.QtCore import Qt
+import os
 from pathlib import Path
 
 
+ARCHIVE_EXTENSIONS = ('.cbz', '.cbr', '.pdf')
+
+
 class FileManagementWidget(QWidget):
     """
     Widget for managing comic archive files and folders.
@@ -22,6 +26,9 @@ class FileManagementWidget(QWidget):
 
     files_changed = pyqtSignal(list)  # Emits list of loaded file paths
 
+    # Changes within this window are reported by a single files_changed emission
+    FILES_CHANGED_DEBOUNCE_MS = 50
+
     def __init__(self, parent=None):
         """
         Initialize the FileManagementWidget.
@@ -33,8 +40,16 @@ class FileManagementWidget(QWidget):
         self.setAcceptDrops(True)
         self.setup_ui()
         self.loaded_files = []
+        self.file_stats = {}  # path -> (size_bytes, lowercase extension), stat'ed once per file
         self.last_loaded_folder = None  # Track last loaded folder
+        self.list_order_dirty = False  # Set when the list widget was reordered by drag-and-drop
 
+        self.files_changed_timer = QTimer(self)
+        self.files_changed_timer.setSingleShot(True)
+        self.files_changed_timer.setInterval(self.FILES_CHANGED_DEBOUNCE_MS)
+        self.files_changed_timer.timeout.connect(self.emit_files_changed)
+
+    @pyqtSlot(QPoint)
     def show_context_menu(self, pos):
         """
         Show context menu for file list with options to refresh or remove selected files.
@@ -74,17 +89,16 @@ class FileManagementWidget(QWidget):
     def delete_selected_files(self):
         """
         Remove selected files from the loaded files list and update the display.
-        Emits files_changed signal.
+        Schedules a files_changed signal.
         """
         selected_items = self.file_list.selectedItems()
         if not selected_items:
             return
-        for item in selected_items:
-            full_path = item.data(Qt.ItemDataRole.UserRole)
-            if full_path in self.loaded_files:
-                self.loaded_files.remove(full_path)
+        self.apply_pending_reorder()
+        selected = {item.data(Qt.ItemDataRole.UserRole) for item in selected_items}
+        self.loaded_files = [f for f in self.loaded_files if f not in selected]
         self.update_file_list()
-        self.files_changed.emit(self.loaded_files)
+        self.schedule_files_changed()
 
     def dragEnterEvent(self, event):
         """
@@ -103,20 +117,18 @@ class FileManagementWidget(QWidget):
         Args:
             event: QDropEvent
         """
-        archive_exts = [".cbz", ".cbr", ".pdf"]
         files_to_add = []
         for url in event.mimeData().urls():
             path = url.toLocalFile()
             p = Path(path)
-            if p.is_file() and any(p.name.lower().endswith(ext) for ext in archive_exts):
+            if p.is_file() and p.name.lower().endswith(ARCHIVE_EXTENSIONS):
                 files_to_add.append(str(p))
             elif p.is_dir():
-                for ext in archive_exts:
-                    files_to_add.extend(str(f) for f in p.rglob(f"*{ext}"))
+                files_to_add.extend(self._scan_archives(str(p)))
         if files_to_add:
-            self.loaded_files.extend(files_to_add)
+            self.add_loaded_files(files_to_add)
             self.update_file_list()
-            self.files_changed.emit(self.loaded_files)
+            self.schedule_files_changed()
 
     def setup_ui(self):
         """
@@ -155,9 +167,8 @@ class FileManagementWidget(QWidget):
         layout.addWidget(self.file_list)
 
         # Info panel
-        self.info_label = QLabel(
-            "Total: 0 files, Size: 0 MB, CBZ: 0, CBR: 0, PDF: 0"
-        )
+        self.last_info_text = "Total: 0 files, Size: 0 MB, CBZ: 0, CBR: 0, PDF: 0"
+        self.info_label = QLabel(self.last_info_text)
         self.info_label.setStyleSheet(
             "color: #666; padding: 8px; border: 1px solid #ccc; border-radius: 3px;"
         )
@@ -170,52 +181,75 @@ class FileManagementWidget(QWidget):
         self.clear_all_btn.clicked.connect(self.clear_all)
         self.refresh_file_list_btn.clicked.connect(self.refresh_file_list)
 
+    @pyqtSlot()
     def add_folder(self):
         """
         Open a dialog to select a folder and add all supported archive files from it.
-        Updates loaded files and emits files_changed signal.
+        Updates loaded files and schedules a files_changed signal.
         """
         folder = QFileDialog.getExistingDirectory(self, "Select Folder")
         if folder:
             self.last_loaded_folder = folder
-            archive_exts = ["*.cbz", "*.cbr", "*.pdf"]
-            files = []
-            for ext in archive_exts:
-                files.extend(str(f) for f in Path(folder).rglob(ext))
-            self.loaded_files.extend(files)
+            self.add_loaded_files(self._scan_archives(folder))
             self.update_file_list()
-            self.files_changed.emit(self.loaded_files)
+            self.schedule_files_changed()
 
+    @pyqtSlot()
     def add_files(self):
         """
         Open a dialog to select files and add them to the loaded files list.
-        Emits files_changed signal.
+        Schedules a files_changed signal.
         """
         files, _ = QFileDialog.getOpenFileNames(self, "Select Comic Archives", "", "Comic Archives (*.cbz *.cbr *.pdf)")
         if files:
-            self.loaded_files.extend(files)
+            self.add_loaded_files(files)
             self.update_file_list()
-            self.files_changed.emit(self.loaded_files)
+            self.schedule_files_changed()
 
+    def add_loaded_files(self, files: list):
+        """
+        Append files to the loaded list, skipping any already loaded, so adding
+        the same folder twice does not duplicate entries.
+
+        Args:
+            files: Full paths to add, in display order.
+        """
+        self.apply_pending_reorder()
+        seen = set(self.loaded_files)
+        for f in files:
+            if f not in seen:
+                seen.add(f)
+                self.loaded_files.append(f)
+
+    @pyqtSlot()
     def clear_all(self):
         """
-        Clear all loaded files from the list and emit files_changed signal.
+        Clear all loaded files from the list and schedule a files_changed signal.
         """
         self.loaded_files = []
+        self.list_order_dirty = False
+        self.file_stats.clear()
         self.update_file_list()
-        self.files_changed.emit(self.loaded_files)
+        self.schedule_files_changed()
 
     def update_file_list(self):
         """
         Update the QListWidget display to match the loaded files list.
         Also updates the info panel.
         """
-        self.file_list.clear()
-        for f in self.loaded_files:
-            file_name = Path(f).name
-            item = QListWidgetItem(file_name)
-            item.setData(Qt.ItemDataRole.UserRole, f)  # Store full path
-            self.file_list.addItem(item)
+        # Repaint and widget signals are held off until the whole list is rebuilt.
+        # The model's own signals are left alone, since the view depends on them.
+        self.file_list.setUpdatesEnabled(False)
+        self.file_list.blockSignals(True)
+        try:
+            self.file_list.clear()
+            for f in self.loaded_files:
+                item = QListWidgetItem(os.path.basename(f))
+                item.setData(Qt.ItemDataRole.UserRole, f)  # Store full path
+                self.file_list.addItem(item)
+        finally:
+            self.file_list.blockSignals(False)
+            self.file_list.setUpdatesEnabled(True)
         self.update_info_panel()
 
     def update_info_panel(self):
@@ -223,13 +257,71 @@ class FileManagementWidget(QWidget):
         Update the info panel to show file counts and total size for loaded files.
         """
         total_files = len(self.loaded_files)
-        cbz_count = sum(1 for f in self.loaded_files if f.lower().endswith('.cbz'))
-        cbr_count = sum(1 for f in self.loaded_files if f.lower().endswith('.cbr'))
-        pdf_count = sum(1 for f in self.loaded_files if f.lower().endswith('.pdf'))
-        total_size = sum(Path(f).stat().st_size for f in self.loaded_files if Path(f).exists())
+        counts = {'.cbz': 0, '.cbr': 0, '.pdf': 0}
+        total_size = 0
+        for f in self.loaded_files:
+            size, ext = self.get_file_stats(f)
+            if ext in counts:
+                counts[ext] += 1
+            total_size += size
         total_size_mb = round(total_size / (1024 * 1024), 1)
-        info_text = f"Total: {total_files} files, Size: {total_size_mb} MB, CBZ: {cbz_count}, CBR: {cbr_count}, PDF: {pdf_count}"
-        self.info_label.setText(info_text)
+        info_text = (
+            f"Total: {total_files} files, Size: {total_size_mb} MB, "
+            f"CBZ: {counts['.cbz']}, CBR: {counts['.cbr']}, PDF: {counts['.pdf']}"
+        )
+        # Reorders and re-adds often leave the summary unchanged; skip the label update then
+        if info_text != self.last_info_text:
+            self.info_label.setText(info_text)
+            self.last_info_text = info_text
+
+    def _scan_archives(self, root: str) -> list:
+        """
+        Find all supported archives under a folder in a single os.scandir walk,
+        recording each file's size in file_stats along the way.
+
+        Args:
+            root: Folder to search recursively.
+
+        Returns:
+            list: Full paths of the .cbz, .cbr and .pdf files found.
+        """
+        found = []
+        pending = [root]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                            continue
+                        ext = entry.name[-4:].lower()
+                        if ext in ARCHIVE_EXTENSIONS and entry.is_file():
+                            found.append(entry.path)
+                            self.file_stats[entry.path] = (entry.stat().st_size, ext)
+            except OSError:
+                continue  # Unreadable folder; skip it like rglob did
+        return found
+
+    def get_file_stats(self, file_path: str) -> tuple:
+        """
+        Return a loaded file's size and extension, stat'ing it only the first
+        time it is seen so info panel refreshes make no filesystem calls.
+
+        Args:
+            file_path: Full path of a loaded file.
+
+        Returns:
+            tuple: (size_bytes, lowercase extension); size is 0 if the file is missing.
+        """
+        stats = self.file_stats.get(file_path)
+        if stats is None:
+            try:
+                size = os.stat(file_path).st_size
+            except OSError:
+                size = 0
+            stats = (size, os.path.splitext(file_path)[1].lower())
+            self.file_stats[file_path] = stats
+        return stats
 
     def get_selected_files(self):
         """
@@ -239,31 +331,62 @@ class FileManagementWidget(QWidget):
         Returns:
             list: List of loaded file paths.
         """
+        self.apply_pending_reorder()
         return self.loaded_files
 
+    @pyqtSlot()
     def refresh_file_list(self):
         """
         Rescan all parent folders of loaded files for supported files and update the list.
-        Removes duplicates and emits files_changed signal.
+        Removes duplicates and schedules a files_changed signal.
         """
-        archive_exts = ["*.cbz", "*.cbr", "*.pdf"]
-        parent_dirs = set(Path(f).parent for f in self.loaded_files)
+        self.list_order_dirty = False  # The rescan replaces the list wholesale
+        parent_dirs = set(os.path.dirname(f) for f in self.loaded_files)
+        # Sizes may have changed since the last scan; the rescan re-records them
+        self.file_stats.clear()
         files = []
         for folder in parent_dirs:
-            for ext in archive_exts:
-                files.extend(str(f) for f in folder.rglob(ext))
+            files.extend(self._scan_archives(folder))
         # Remove duplicates and update
         self.loaded_files = list(dict.fromkeys(files))
         self.update_file_list()
-        self.files_changed.emit(self.loaded_files)
+        self.schedule_files_changed()
 
+    @pyqtSlot()
     def sync_loaded_files_with_list(self, *args):
         """
-        Sync the loaded files list with the QListWidget items after a drag-and-drop reorder.
-        Emits files_changed signal.
+        Mark the loaded files list as out of order after a drag-and-drop reorder.
+        rowsMoved can fire several times per gesture, so the list is re-read
+        once, when the debounced files_changed signal is emitted.
+        """
+        self.list_order_dirty = True
+        self.schedule_files_changed()
+
+    def apply_pending_reorder(self):
         """
+        If the list widget was reordered since the last sync, rebuild the loaded
+        files list from its current item order. Called before loaded_files is
+        read or modified.
+        """
+        if not self.list_order_dirty:
+            return
         self.loaded_files = [
             self.file_list.item(i).data(Qt.ItemDataRole.UserRole)
             for i in range(self.file_list.count())
         ]
-        self.files_changed.emit(self.loaded_files)
+        self.list_order_dirty = False
+
+    def schedule_files_changed(self):
+        """
+        Request a files_changed emission. Calls in quick succession (e.g. during
+        a folder import or a drag) collapse into one after FILES_CHANGED_DEBOUNCE_MS.
+        """
+        self.files_changed_timer.start()
+
+    @pyqtSlot()
+    def emit_files_changed(self):
+        """
+        Emit files_changed with a snapshot of the loaded files.
+        """
+        self.apply_pending_reorder()
+        self.files_changed.emit(list(self.loaded_files))
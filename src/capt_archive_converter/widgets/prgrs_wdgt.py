@@ -5,8 +5,10 @@ Reusable widget for displaying progress messages and a progress bar.
 Designed for integration into multiple GUI windows.
 """
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QProgressBar, QGroupBox
-from PyQt6.QtCore import pyqtSignal
+import time
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPlainTextEdit, QProgressBar, QGroupBox
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, QTimer
 
 
 class ProgressWidget(QWidget):
@@ -18,6 +20,13 @@ class ProgressWidget(QWidget):
     progress_updated = pyqtSignal(int)  # Emits progress bar value
     message_appended = pyqtSignal(str)  # Emits appended message
 
+    # Log lines kept in the text area; older lines are dropped
+    MAX_LOG_LINES = 1000
+    # Above this many messages per second, lines are batched instead of appended one by one
+    MAX_IMMEDIATE_MESSAGES_PER_SEC = 60
+    # Batched lines are flushed at ~30 Hz
+    FLUSH_INTERVAL_MS = 33
+
     def __init__(self, parent=None):
         """
         Initialise the ProgressWidget.
@@ -26,6 +35,9 @@ class ProgressWidget(QWidget):
             parent: Optional parent widget.
         """
         super().__init__(parent)
+        self.pending_messages = []
+        self.rate_window_start = 0.0
+        self.rate_window_count = 0
         self.setup_ui()
 
     def setup_ui(self):
@@ -42,8 +54,9 @@ class ProgressWidget(QWidget):
         group_layout = QVBoxLayout(self.progress_group)
 
         # Progress text area
-        self.progress_text = QTextEdit()
+        self.progress_text = QPlainTextEdit()
         self.progress_text.setReadOnly(True)
+        self.progress_text.setMaximumBlockCount(self.MAX_LOG_LINES)
         self.progress_text.setMinimumHeight(100)
         self.progress_text.setMaximumHeight(100)
         self.progress_text.setPlainText("Ready to start processing...")
@@ -57,31 +70,76 @@ class ProgressWidget(QWidget):
 
         layout.addWidget(self.progress_group)
 
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush_messages)
+
+    @pyqtSlot(str)
     def append_message(self, message):
         """
-        Append a status message to the text output.
+        Append a status message to the text output. appendPlainText keeps the
+        view scrolled to the bottom. When messages arrive faster than
+        MAX_IMMEDIATE_MESSAGES_PER_SEC they are buffered and appended in
+        batches by flush_messages.
 
         Args:
             message (str): The message to append.
         """
-        self.progress_text.append(message)
-        # Optionally scroll to bottom
-        self.progress_text.verticalScrollBar().setValue(self.progress_text.verticalScrollBar().maximum())
+        now = time.monotonic()
+        if now - self.rate_window_start >= 1.0:
+            self.rate_window_start = now
+            self.rate_window_count = 0
+        self.rate_window_count += 1
+        if self.pending_messages or self.rate_window_count > self.MAX_IMMEDIATE_MESSAGES_PER_SEC:
+            self.pending_messages.append(message)
+            if not self.flush_timer.isActive():
+                self.flush_timer.start()
+        else:
+            self.progress_text.appendPlainText(message)
         self.message_appended.emit(message)
 
+    @pyqtSlot()
+    def flush_messages(self):
+        """
+        Append all buffered messages to the text output in one call.
+        """
+        if self.pending_messages:
+            self.progress_text.appendPlainText("\n".join(self.pending_messages))
+            self.pending_messages.clear()
+
+    @pyqtSlot(str)
+    def append_status(self, message):
+        """
+        Append a worker status message, suffixed with the current progress percentage.
+        Worker status signals connect to this slot directly.
+
+        Args:
+            message (str): The status message to append.
+        """
+        current_progress = self.progress_bar.value()
+        self.append_message(f"{message} ({current_progress}%)" if current_progress > 0 else message)
+
+    @pyqtSlot(int)
     def set_progress(self, value: int):
         """
         Set the progress bar value and emit progress_updated signal.
+        Repeated values are ignored, so they cost no repaint or signal.
 
         Args:
             value (int): Progress value (0-100).
         """
+        if value == self.progress_bar.value():
+            return
         self.progress_bar.setValue(value)
         self.progress_updated.emit(value)
 
     def clear(self):
         """
         Clear the progress text area and reset the progress bar to zero.
+        Buffered messages are discarded.
         """
+        self.flush_timer.stop()
+        self.pending_messages.clear()
         self.progress_text.clear()
         self.progress_bar.setValue(0)
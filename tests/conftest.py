@@ -0,0 +1,100 @@
+import os
+import shutil
+import sys
+import tempfile
+import pytest
+
+# Render Qt widgets off-screen so parallel workers never contend for a display.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# tmp_path lives in RAM (/dev/shm) on Linux when at least this much of it is free
+SHM_MIN_FREE_BYTES = 256 * 1024 * 1024
+# The RAM basetemp this process created, removed again at unconfigure
+_shm_basetemp = None
+
+
+def pytest_configure(config):
+    global _shm_basetemp
+    # Keep an explicit --basetemp (xdist also sets one per worker from the controller's)
+    if config.option.basetemp or sys.platform != "linux":
+        return
+    shm = "/dev/shm"
+    if not os.path.isdir(shm) or not os.access(shm, os.W_OK):
+        return
+    stats = os.statvfs(shm)
+    if stats.f_bavail * stats.f_frsize >= SHM_MIN_FREE_BYTES:
+        # A fresh directory per run, so concurrent runs never clear each other's
+        _shm_basetemp = tempfile.mkdtemp(dir=shm, prefix="pytest-")
+        config.option.basetemp = _shm_basetemp
+
+
+def pytest_unconfigure(config):
+    global _shm_basetemp
+    if _shm_basetemp is not None:
+        shutil.rmtree(_shm_basetemp, ignore_errors=True)
+        _shm_basetemp = None
+
+
+def _build_minimal_pdf() -> bytes:
+    """A one-page, 200x300 pt PDF holding a single filled rectangle."""
+    content = b"0 0 1 rg 20 20 160 260 re f"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 200 300] /Contents 4 0 R >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return bytes(out)
+
+
+@pytest.fixture(scope="session")
+def sample_pdf(tmp_path_factory):
+    """Path to a minimal one-page PDF, written once per session."""
+    path = tmp_path_factory.mktemp("fixtures") / "sample.pdf"
+    path.write_bytes(_build_minimal_pdf())
+    return path
+
+
+@pytest.fixture(scope="session")
+def monkeypatch_session():
+    """A MonkeyPatch whose patches last for the whole session."""
+    mp = pytest.MonkeyPatch()
+    yield mp
+    mp.undo()
+
+
+@pytest.fixture(scope="session")
+def logs_dir(tmp_path_factory, monkeypatch_session):
+    """One logs directory, shared by every test that logs, in place of ./logs."""
+    from utils.logger import shutdown_logging
+    logs = tmp_path_factory.mktemp("logs_root") / "logs"
+    shutdown_logging()  # Loggers set up before the patch point at ./logs
+    monkeypatch_session.setattr("utils.logger.Path", lambda p="logs": logs)
+    yield logs
+    shutdown_logging()
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """One QApplication for the whole session (overrides pytest-qt's fixture)."""
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def disconnect_all(signal):
+    """Drop every slot a test connected to signal; no-op when nothing is connected."""
+    try:
+        signal.disconnect()
+    except TypeError:
+        pass
@@ -1,6 +1,4 @@
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import shutil
 import pytest
 from pathlib import Path
 from processors.arc_conv_cb_proc import ArchiveArchiveConverter, ArchiveConversionError
@@ -46,6 +44,21 @@ def test_convert_batch_empty_list(converter):
     assert results == []
 
 
+def test_convert_batch_concurrent_keeps_order(monkeypatch):
+    progress = []
+    conv = ArchiveArchiveConverter(progress_callback=lambda c, t: progress.append(c))
+
+    def dummy_convert_file(file_path, target_format, delete_original=False, progress_callback=None, status_callback=None):
+        progress_callback(100, 100)
+        return str(file_path), str(file_path.with_suffix(".cbz")), True, ""
+
+    monkeypatch.setattr(conv, "convert_file", dummy_convert_file)
+    files = ["a.cbr", "b.cbr", "c.cbr"]
+    results = conv.convert_batch(files, "cbz")
+    assert [r[0] for r in results] == files
+    assert progress[-1] == 100
+
+
 def test_callbacks_are_called(monkeypatch):
     # Test that progress and status callbacks are called
     called = {"progress": False, "status": False}
@@ -76,8 +89,17 @@ def test_callbacks_are_called(monkeypatch):
     assert called["status"]
 
 
-def test_convert_file_real_archive(converter):
-    test_file = Path("tests/test-archive.cbz")
+def test_convert_file_real_archive(converter, tmp_path):
+    test_file = tmp_path / "test-archive.cbz"
+    shutil.copy("tests/test-archive.cbz", test_file)
     result = converter.convert_file(test_file, "cbr")
     assert result[2]  # success should be True
     assert result[1].endswith(".cbr")
+
+
+def test_convert_file_same_format_is_noop(converter, tmp_path):
+    test_file = tmp_path / "already.cbz"
+    shutil.copy("tests/test-archive.cbz", test_file)
+    result = converter.convert_file(test_file, "cbz", delete_original=True)
+    assert result == (str(test_file), str(test_file), True, "")
+    assert test_file.exists()
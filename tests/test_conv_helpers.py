@@ -1,6 +1,6 @@
-import sys
+import io
 import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import zipfile
 import pytest
 from pathlib import Path
 from utils.arc_conv_helpers import (
@@ -8,16 +8,28 @@ from utils.arc_conv_helpers import (
     extract_zip_archive,
     create_zip_archive,
     create_rar_archive,
-    create_per_file_progress_callback
+    stream_rar_to_zip_archive,
+    iter_files,
+    create_per_file_progress_callback,
+    PerFileStatusCallback,
+    BatchProgressCallback
 )
 
 
+def _build_zip(entries):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
+        for name, data in entries:
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+_ZIP_FILE_TXT = _build_zip([("file.txt", "hello")])
+
+
 def test_extract_zip_archive(tmp_path):
-    # Create a test ZIP file
-    import zipfile
     zip_path = tmp_path / "test.zip"
-    with zipfile.ZipFile(zip_path, "w") as zf:
-        zf.writestr("file.txt", "hello")
+    zip_path.write_bytes(_ZIP_FILE_TXT)
     extract_path = tmp_path / "extracted"
     extract_path.mkdir()
     called = []
@@ -44,25 +56,60 @@ def test_create_zip_archive(tmp_path):
     (src / "b.txt").write_text("B")
     zip_path = tmp_path / "out.zip"
     called = []
-    create_zip_archive(src, zip_path, lambda c, t: called.append((c, t)))
+    create_zip_archive(src, zip_path, lambda c, t: called.append((c, t)), compression=zipfile.ZIP_STORED)
     assert zip_path.exists()
-    import zipfile
     with zipfile.ZipFile(zip_path) as zf:
         assert "a.txt" in zf.namelist()
         assert "b.txt" in zf.namelist()
+        assert all(info.compress_type == zipfile.ZIP_STORED for info in zf.infolist())
     assert called  # Progress callback called
     
 
+def test_create_zip_archive_includes_subdirectories(tmp_path):
+    src = tmp_path / "src"
+    (src / "chapter1").mkdir(parents=True)
+    (src / "chapter1" / "page1.jpg").write_bytes(b"\xff\xd8\xff" + b"\x00" * 16)
+    (src / "cover.jpg").write_bytes(b"\xff\xd8\xff" + b"\x00" * 16)
+    assert sorted(iter_files(src)) == [str(src / "chapter1" / "page1.jpg"), str(src / "cover.jpg")]
+    zip_path = tmp_path / "out.cbz"
+    create_zip_archive(src, zip_path)
+    with zipfile.ZipFile(zip_path) as zf:
+        assert sorted(zf.namelist()) == ["chapter1/page1.jpg", "cover.jpg"]
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs symlinks and FIFOs")
+def test_iter_files_skips_directory_links_and_special_files(tmp_path):
+    src = tmp_path / "src"
+    (src / "chapter1").mkdir(parents=True)
+    (src / "chapter1" / "page1.jpg").write_bytes(b"\xff\xd8\xff")
+    (src / "linked_chapter").symlink_to(src / "chapter1", target_is_directory=True)
+    (src / "linked_page.jpg").symlink_to(src / "chapter1" / "page1.jpg")
+    os.mkfifo(src / "pipe")
+    assert sorted(iter_files(src)) == [str(src / "chapter1" / "page1.jpg"), str(src / "linked_page.jpg")]
+
+
+def test_create_zip_archive_stores_compressed_images(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "page1.png").write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 64)
+    (src / "ComicInfo.xml").write_text("<ComicInfo></ComicInfo>")
+    zip_path = tmp_path / "out.cbz"
+    create_zip_archive(src, zip_path)
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.getinfo("page1.png").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("ComicInfo.xml").compress_type == zipfile.ZIP_DEFLATED
+
+
 def test_create_zip_archive_error(tmp_path):
     # Try to zip a non-existent directory
     src = tmp_path / "missing"
     zip_path = tmp_path / "out.zip"
     with pytest.raises(RuntimeError):
-        create_zip_archive(src, zip_path)
+        create_zip_archive(src, zip_path, compression=zipfile.ZIP_STORED)
 
 
 def test_create_rar_archive_subprocess(monkeypatch, tmp_path):
-    # Mock subprocess.run to simulate rar creation
+    # Stub the helper's rar runner to simulate rar creation
     src = tmp_path / "src"
     src.mkdir()
     (src / "a.txt").write_text("A")
@@ -72,9 +119,23 @@ def test_create_rar_archive_subprocess(monkeypatch, tmp_path):
     class DummyResult:
         returncode = 0
         stderr = ""
-    monkeypatch.setattr("subprocess.run", lambda *a, **kw: DummyResult())
+    monkeypatch.setattr("utils.arc_conv_helpers._run", lambda *a, **kw: DummyResult())
     create_rar_archive(src, rar_path, lambda c, t: called.append((c, t)))
     assert called  # Progress callback called
+    assert called[0][1] == 1  # Total counts the files under src
+
+
+def test_create_rar_archive_skips_walk_without_progress(monkeypatch, tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.txt").write_text("A")
+
+    class DummyResult:
+        returncode = 0
+        stderr = ""
+    monkeypatch.setattr("utils.arc_conv_helpers._run", lambda *a, **kw: DummyResult())
+    monkeypatch.setattr("utils.arc_conv_helpers.iter_files", lambda *a: pytest.fail("source was walked"))
+    create_rar_archive(src, tmp_path / "out.rar")
 
 
 def test_create_rar_archive_missing_tool(monkeypatch, tmp_path):
@@ -85,24 +146,46 @@ def test_create_rar_archive_missing_tool(monkeypatch, tmp_path):
     
     def raise_fn(*a, **kw):
         raise FileNotFoundError()
-    monkeypatch.setattr("subprocess.run", raise_fn)
+    monkeypatch.setattr("utils.arc_conv_helpers._run", raise_fn)
     with pytest.raises(RuntimeError):
         create_rar_archive(src, rar_path)
 
 
 def test_create_per_file_progress_callback():
-    called = []
-    cb = create_per_file_progress_callback(lambda p, t: called.append((p, t)), 0, 2, False)
+    state = [0, None]  # Emit count, last percentage
+
+    def record(p, t):
+        state[0] += 1
+        state[1] = p
+    cb = create_per_file_progress_callback(record, 0, 2, False)
     cb(1, 2)
-    assert called[0][0] <= 99  # Not last file, should not emit 100%
-    called_last = []
-    cb_last = create_per_file_progress_callback(lambda p, t: called_last.append((p, t)), 1, 2, True)
+    assert state[0] == 1 and state[1] <= 99  # Not last file, should not emit 100%
+    cb(1, 2)
+    assert state[0] == 1  # Same percentage is not emitted twice
+    cb_last = create_per_file_progress_callback(record, 1, 2, True)
     cb_last(2, 2)
-    assert called_last[0][0] == 100  # Last file emits 100%
+    assert state == [2, 100]  # Last file emits 100%
+
+
+def test_batch_progress_callback():
+    called = []
+    batch = BatchProgressCallback(lambda p, t: called.append(p), 2)
+    batch.for_file(0)(100, 100)
+    assert called == [50]
+    batch.for_file(1)(100, 100)
+    assert called == [50, 100]
+
+
+def test_per_file_status_callback():
+    called = []
+    cb = PerFileStatusCallback(called.append, 1, 3)
+    cb("Extracting...")
+    assert called == ["File 2/3: Extracting..."]
+    PerFileStatusCallback(None, 0, 1)("Ignored")  # No base callback, no error
 
 
 def test_extract_rar_archive(tmp_path):
-    rar_path = Path("tests/rar-extraction-test.rar")
+    rar_path = Path("tests/test-archive.cbr")
     extract_path = tmp_path / "extracted_rar"
     extract_path.mkdir()
     called = []
@@ -111,3 +194,14 @@ def test_extract_rar_archive(tmp_path):
     extracted_files = list(extract_path.iterdir())
     assert extracted_files
     assert called  # Progress callback called
+
+
+def test_stream_rar_to_zip_archive(tmp_path):
+    rar_path = Path("tests/test-archive.cbr")
+    zip_path = tmp_path / "streamed.cbz"
+    called = []
+    stream_rar_to_zip_archive(rar_path, zip_path, lambda c, t: called.append((c, t)))
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.namelist()
+        assert all(info.compress_type == zipfile.ZIP_STORED for info in zf.infolist())
+    assert called[-1] == (100, 100)
@@ -1,12 +1,14 @@
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import io
+import shutil
+import fitz
 import pytest
 from pathlib import Path
-from processors.arc_conv_pdf_proc import PdfArchiveConverter, ArchiveConversionError
+from PIL import Image
+import processors.arc_conv_pdf_proc as pdf_proc
+from processors.arc_conv_pdf_proc import PdfArchiveConverter, ArchiveConversionError, _render_pdf_pages
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def converter():
     return PdfArchiveConverter()
 
@@ -67,8 +69,79 @@ def test_callbacks_are_called(monkeypatch):
     assert called["status"]
     
 
-def test_convert_file_real_pdf(converter):
-    test_file = Path("tests/test-archive.pdf")
+def test_convert_file_real_pdf(converter, sample_pdf, tmp_path):
+    test_file = tmp_path / "sample.pdf"
+    shutil.copy(sample_pdf, test_file)
     result = converter.convert_file(test_file, "cbz")
     assert result[2]  # success should be True
     assert result[1].endswith(".cbz")
+
+
+def test_render_pdf_pages_returns_png_bytes(sample_pdf):
+    rendered = _render_pdf_pages(str(sample_pdf), range(0, 1))
+    assert [name for name, _ in rendered] == ["page_001.png"]
+    assert rendered[0][1].startswith(b"\x89PNG")
+
+
+def test_convert_batch_parallel_keeps_order(sample_pdf, tmp_path):
+    sources = []
+    for name in ("first.pdf", "second.pdf"):
+        target = tmp_path / name
+        shutil.copy(sample_pdf, target)
+        sources.append(str(target))
+    results = PdfArchiveConverter()._convert_batch_parallel(sources, "cbz", False, None)
+    assert [r[0] for r in results] == sources
+    assert all(r[2] for r in results)
+    assert (tmp_path / "second.cbz").exists()
+
+
+def test_convert_batch_with_progress_stays_serial(sample_pdf, tmp_path, monkeypatch):
+    sources = []
+    for name in ("first.pdf", "second.pdf"):
+        target = tmp_path / name
+        shutil.copy(sample_pdf, target)
+        sources.append(str(target))
+    progress = []
+    conv = PdfArchiveConverter(progress_callback=lambda c, t: progress.append(c))
+    monkeypatch.setattr(conv, "_convert_batch_parallel", lambda *a: pytest.fail("parallel path taken"))
+    results = conv.convert_batch(sources, "cbz")
+    assert all(r[2] for r in results)
+    assert progress[-1] == 100
+
+
+def test_render_pool_is_reused_across_a_batch(tmp_path, monkeypatch):
+    sources = []
+    for name in ("first.pdf", "second.pdf"):
+        doc = fitz.open()
+        for _ in range(3):
+            doc.new_page(width=100, height=150)
+        doc.save(str(tmp_path / name))
+        doc.close()
+        sources.append(str(tmp_path / name))
+    pools = []
+
+    class CountingPool(pdf_proc.ProcessPoolExecutor):
+        def __init__(self, *a, **kw):
+            pools.append(self)
+            super().__init__(*a, **kw)
+    monkeypatch.setattr(pdf_proc, "ProcessPoolExecutor", CountingPool)
+    conv = PdfArchiveConverter(progress_callback=lambda c, t: None, render_workers=2)
+    monkeypatch.setattr(conv, "PARALLEL_RENDER_MIN_PAGES", 1)
+    results = conv.convert_batch(sources, "cbz")
+    assert all(r[2] for r in results)
+    assert len(pools) == 1  # One pool rendered both PDFs
+    assert conv.render_pool is None  # Shut down when the batch finished
+
+
+def test_render_pdf_pages_scales_with_dpi(sample_pdf):
+    (_, low), = _render_pdf_pages(str(sample_pdf), range(0, 1), dpi=72)
+    (_, high), = _render_pdf_pages(str(sample_pdf), range(0, 1), dpi=144)
+    with Image.open(io.BytesIO(low)) as low_img, Image.open(io.BytesIO(high)) as high_img:
+        assert high_img.width == pytest.approx(low_img.width * 2, abs=1)
+        assert high_img.mode == "RGB"
+
+
+def test_render_pdf_pages_through_mmap(sample_pdf, monkeypatch):
+    monkeypatch.setattr(pdf_proc, "MMAP_MIN_PDF_SIZE", 0)
+    rendered = _render_pdf_pages(str(sample_pdf), range(0, 1))
+    assert rendered[0][1].startswith(b"\x89PNG")
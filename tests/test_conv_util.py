@@ -1,8 +1,10 @@
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import io
+import threading
+import time
+import zipfile
 import pytest
 from pathlib import Path
+import utils.arc_convert_util as util
 from utils.arc_convert_util import (
     ArchiveConversionError,
     ArchiveConverter,
@@ -10,12 +12,24 @@ from utils.arc_convert_util import (
 )
 
 
+def _build_zip(entries):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
+        for name, data in entries:
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+_ZIP_PAGE = _build_zip([("page1.png", "data")])
+_ZIP_COMIC = _build_zip([("page1.png", "data"), ("comicinfo.xml", "<xml></xml>")])
+
+
 def test_archive_conversion_error():
     with pytest.raises(ArchiveConversionError):
         raise ArchiveConversionError("Test error")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def converter():
     return ArchiveConverter()
 
@@ -27,13 +41,26 @@ def test_detect_archive_format_pdf(converter, tmp_path):
 
 
 def test_detect_archive_format_zip(converter, tmp_path):
-    import zipfile
     zip_file = tmp_path / "test.cbz"
-    with zipfile.ZipFile(zip_file, "w") as zf:
-        zf.writestr("page1.png", "data")
+    zip_file.write_bytes(_ZIP_PAGE)
     assert converter.detect_archive_format(zip_file) == "CBZ"
 
 
+def test_detect_archive_format_is_cached(converter, tmp_path, monkeypatch):
+    zip_file = tmp_path / "cached.cbz"
+    zip_file.write_bytes(_ZIP_PAGE)
+    assert converter.detect_archive_format(zip_file) == "CBZ"
+    monkeypatch.setattr("utils.arc_convert_util._detect_format", lambda p: None)
+    assert converter.detect_archive_format(zip_file) == "CBZ"  # Served from cache
+
+
+def test_detect_archive_format_reads_magic_not_suffix(converter, tmp_path, monkeypatch):
+    mislabeled = tmp_path / "mislabeled.cbr"
+    mislabeled.write_bytes(_ZIP_PAGE)
+    monkeypatch.setattr("utils.arc_convert_util.zipfile.is_zipfile", lambda p: False)
+    assert converter.detect_archive_format(mislabeled) == "CBZ"  # Matched on the PK header
+
+
 def test_detect_archive_format_rar(converter):
     cbr_file = Path("tests/test-archive.cbr")
     if cbr_file.exists():
@@ -47,25 +74,23 @@ def test_detect_archive_format_unknown(converter, tmp_path):
 
 
 def test_validate_comic_archive_zip(converter, tmp_path):
-    import zipfile
     zip_file = tmp_path / "comic.cbz"
-    with zipfile.ZipFile(zip_file, "w") as zf:
-        zf.writestr("page1.png", "data")
-        zf.writestr("comicinfo.xml", "<xml></xml>")
+    zip_file.write_bytes(_ZIP_COMIC)
     valid, fmt, details = converter.validate_comic_archive(zip_file)
     assert valid
     assert fmt == "CBZ"
     assert details["image_count"] == 1
     assert details["has_metadata"]
+    assert "image_files" not in details
+    assert list(converter.iter_image_names(zip_file)) == ["page1.png"]
+    assert details["total_size"] == 4
 
 
-def test_validate_comic_archive_pdf(converter, tmp_path):
+def test_validate_comic_archive_pdf(converter, sample_pdf):
     # Requires PyMuPDF (fitz)
-    pdf_file = Path("tests/test_archive.pdf")
-    if pdf_file.exists():
-        valid, fmt, details = converter.validate_comic_archive(pdf_file)
-        assert fmt == "PDF"
-        assert details["image_count"] > 0
+    valid, fmt, details = converter.validate_comic_archive(sample_pdf)
+    assert fmt == "PDF"
+    assert details["image_count"] == 1
 
 
 def test_validate_comic_archive_rar(converter):
@@ -76,6 +101,76 @@ def test_validate_comic_archive_rar(converter):
         assert details["image_count"] > 0
 
 
+def test_validate_comic_archive_rar_runs_no_subprocess(converter, tmp_path, monkeypatch):
+    # rarfile reads RAR headers in Python; validation never needs the unrar tool
+    cbr_file = tmp_path / "copy.cbr"
+    cbr_file.write_bytes(Path("tests/test-archive.cbr").read_bytes())
+    monkeypatch.setattr("rarfile.Popen", lambda *a, **kw: pytest.fail("unrar was started"))
+    valid, fmt, details = converter.validate_comic_archive(cbr_file)
+    assert fmt == "CBR"
+    assert details["image_count"] > 0
+
+
 def test_get_archive_converter():
     conv = get_archive_converter()
     assert isinstance(conv, ArchiveConverter)
+
+
+def test_validate_many_returns_results_in_order(converter, tmp_path):
+    paths = []
+    for name in ("b.cbz", "a.cbz"):
+        path = tmp_path / name
+        path.write_bytes(_ZIP_PAGE)
+        paths.append(path)
+    missing = tmp_path / "missing.cbz"
+    results = converter.validate_many(paths + [missing])
+    assert list(results) == paths + [missing]
+    assert results[paths[0]][0] and results[paths[1]][1] == "CBZ"
+    assert results[missing][:2] == (False, "UNKNOWN")
+
+
+def test_quick_has_metadata(converter, tmp_path):
+    with_meta = tmp_path / "with.cbz"
+    with zipfile.ZipFile(with_meta, "w") as zf:
+        zf.writestr("page1.png", "data")
+        zf.writestr("Issue 1/ComicInfo.xml", "<xml></xml>")
+    without_meta = tmp_path / "without.cbz"
+    without_meta.write_bytes(_ZIP_PAGE)
+    assert converter.quick_has_metadata(with_meta)
+    assert not converter.quick_has_metadata(without_meta)
+    assert not converter.quick_has_metadata(tmp_path / "missing.cbz")
+
+
+def test_get_archive_converter_is_shared():
+    assert get_archive_converter() is get_archive_converter()
+
+
+def test_get_archive_converter_builds_one_instance_across_threads(monkeypatch):
+    built = []
+
+    class SlowConverter(ArchiveConverter):
+        def __init__(self):
+            time.sleep(0.05)  # Widen the window in which a second thread could also build one
+            built.append(self)
+            super().__init__()
+    monkeypatch.setattr(util, "_shared_converter", None)
+    monkeypatch.setattr(util, "ArchiveConverter", SlowConverter)
+    seen = []
+    threads = [threading.Thread(target=lambda: seen.append(util.get_archive_converter())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(built) == 1
+    assert all(conv is built[0] for conv in seen)
+
+
+def test_validate_comic_archive_is_cached(converter, tmp_path, monkeypatch):
+    zip_file = tmp_path / "cached.cbz"
+    zip_file.write_bytes(_ZIP_PAGE)
+    _, _, first = converter.validate_comic_archive(zip_file)
+    first["image_count"] = 99  # Callers' edits must not leak into the cache
+    monkeypatch.setattr(converter, "_validate_zip_archive", lambda *a: pytest.fail("cache miss"))
+    valid, fmt, second = converter.validate_comic_archive(zip_file)
+    assert valid and fmt == "CBZ"
+    assert second["image_count"] == 1
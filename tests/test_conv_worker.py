@@ -1,8 +1,7 @@
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import threading
+import types
 import pytest
-from processors.arc_convert_worker import ConversionWorker
+from processors.arc_convert_worker import ConversionWorker, ConversionRunnable
 
 
 class DummyConverter:
@@ -55,19 +54,50 @@ def test_converter_selection_archive(monkeypatch):
     w.run()
     
 
-def test_emit_progress_throttling(worker):
-    # Should only emit when progress changes by >= 1% or is 100%
+def test_runnable_runs_worker():
+    class RecordingWorker:
+        ran = False
+
+        def run(self):
+            self.ran = True
+
+    recording = RecordingWorker()
+    ConversionRunnable(recording).run()
+    assert recording.ran
+
+
+@pytest.fixture(scope="module")
+def throttle_worker():
+    # One worker and progress recorder shared by every throttling case
     emitted = []
-    
-    def fake_emit(current, total):
-        emitted.append((current, total))
-    worker.progress = DummySignal(fake_emit)
-    worker.emit_progress(1, 100)
-    worker.emit_progress(2, 100)
-    worker.emit_progress(2, 100)  # Should not emit again
-    worker.emit_progress(100, 100)
-    assert emitted[0] == (1, 100)
-    assert emitted[-1] == (100, 100)
+    w = ConversionWorker(["file1.cbr"], "cbz", False)
+    w.progress = DummySignal(lambda current, total: emitted.append((current, total)))
+    return w, emitted
+
+
+@pytest.mark.parametrize("steps,expected", [
+    # Steps are (current, total, seconds since the case started) on a fake clock
+    # Repeated percentages are not emitted again
+    ([(1, 100, 0.0), (1, 100, 0.1)], [(1, 100)]),
+    # Changes inside MIN_PROGRESS_INTERVAL are dropped, 100% always gets through
+    ([(1, 100, 0.0), (2, 100, 0.01), (2, 100, 0.02), (100, 100, 0.03)], [(1, 100), (100, 100)]),
+    # Changes after MIN_PROGRESS_INTERVAL are emitted
+    ([(1, 100, 0.0), (2, 100, 0.05)], [(1, 100), (2, 100)]),
+    ([(100, 100, 0.0), (100, 100, 0.1)], [(100, 100)]),
+    # An empty total counts as 0%
+    ([(0, 0, 0.0)], [(0, 0)]),
+])
+def test_emit_progress_throttling(throttle_worker, steps, expected, monkeypatch):
+    worker, emitted = throttle_worker
+    clock = [0.0]
+    monkeypatch.setattr("processors.arc_convert_worker.time", types.SimpleNamespace(monotonic=lambda: clock[0]))
+    emitted.clear()
+    worker.last_progress_percent = -1
+    worker.last_emit_time = -worker.MIN_PROGRESS_INTERVAL
+    for current, total, at in steps:
+        clock[0] = at
+        worker.emit_progress(current, total)
+    assert emitted == expected
     
 
 def test_error_handling(monkeypatch):
@@ -92,10 +122,40 @@ def test_error_handling(monkeypatch):
     assert any("failed" in msg.lower() for msg in statuses)
     
 
+def test_status_messages_are_emitted_immediately(worker):
+    statuses = []
+    worker.status = DummySignal(lambda msg: statuses.append(msg))
+    worker.emit_status("Initializing archive converter...")
+    worker.emit_status("Starting conversion of 1 file(s)...")
+    # Nothing is held back waiting for a progress update; the widget batches bursts
+    assert statuses == ["Initializing archive converter...", "Starting conversion of 1 file(s)..."]
+
+
+def test_status_messages_from_threads_are_not_lost(worker):
+    statuses = []
+    lock = threading.Lock()
+
+    def record(msg):
+        with lock:
+            statuses.append(msg)
+    worker.status = DummySignal(record)
+
+    def report(n):
+        for i in range(200):
+            worker.emit_status(f"{n}-{i}")
+    threads = [threading.Thread(target=report, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(statuses) == sorted(f"{n}-{i}" for n in range(4) for i in range(200))
+
+
+def _ignore(*a, **kw):
+    pass
+
+
 class DummySignal:
     def __init__(self, func=None):
-        self.func = func
-        
-    def emit(self, *a, **kw):
-        if self.func:
-            self.func(*a, **kw)
+        # emit is the callback itself, so each emit is a single direct call
+        self.emit = func or _ignore
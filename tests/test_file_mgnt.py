@@ -1,15 +1,35 @@
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import pytest
 from widgets.file_mgnt import FileManagementWidget
+from conftest import disconnect_all
 
+pytestmark = pytest.mark.xdist_group("qt")
 
-@pytest.fixture
-def app(qtbot):
+
+@pytest.fixture(scope="module")
+def shared_widget(qapp):
     widget = FileManagementWidget()
-    qtbot.addWidget(widget)
-    return widget
+    yield widget
+    widget.close()
+    widget.deleteLater()
+
+
+@pytest.fixture
+def app(shared_widget):
+    # Reset the shared widget to an empty list before every test
+    shared_widget.clear_all()
+    shared_widget.files_changed_timer.stop()
+    shared_widget.last_loaded_folder = None
+    yield shared_widget
+    shared_widget.files_changed_timer.stop()
+    disconnect_all(shared_widget.files_changed)
+
+
+@pytest.fixture
+def cbz_file(tmp_path):
+    # The path in both Path and str form; loaded_files holds the str
+    test_file = tmp_path / "test.cbz"
+    test_file.write_text("dummy")
+    return test_file, str(test_file)
 
 
 def test_widget_initialization(app):
@@ -19,51 +39,92 @@ def test_widget_initialization(app):
     assert hasattr(app, "add_folder_btn")
 
 
-def test_add_files_updates_list_and_emits_signal(app, qtbot, tmp_path, monkeypatch):
-    test_file = tmp_path / "test.cbz"
-    test_file.write_text("dummy")
+def test_add_files_updates_list_and_emits_signal(app, qtbot, cbz_file, monkeypatch):
+    _, path = cbz_file
     called = []
     app.files_changed.connect(lambda files: called.append(files))
     # Mock QFileDialog.getOpenFileNames to return our test file
-    monkeypatch.setattr("PyQt6.QtWidgets.QFileDialog.getOpenFileNames", lambda *a, **kw: ([str(test_file)], ""))
-    app.add_files()
-    assert str(test_file) in app.loaded_files
+    monkeypatch.setattr("PyQt6.QtWidgets.QFileDialog.getOpenFileNames", lambda *a, **kw: ([path], ""))
+    with qtbot.waitSignal(app.files_changed, timeout=1000):
+        app.add_files()
+    assert path in app.loaded_files
     assert called  # Signal emitted
 
 
-def test_clear_all_clears_files_and_emits_signal(app, qtbot, tmp_path):
-    test_file = tmp_path / "test.cbz"
-    test_file.write_text("dummy")
-    app.loaded_files = [str(test_file)]
+def test_clear_all_clears_files_and_emits_signal(app, qtbot, cbz_file):
+    _, path = cbz_file
+    app.loaded_files = [path]
     called = []
     app.files_changed.connect(lambda files: called.append(files))
-    app.clear_all()
+    with qtbot.waitSignal(app.files_changed, timeout=1000):
+        app.clear_all()
     assert app.loaded_files == []
     assert called  # Signal emitted
 
 
-def test_delete_selected_files_removes_file(app, qtbot, tmp_path):
-    test_file = tmp_path / "test.cbz"
-    test_file.write_text("dummy")
-    app.loaded_files = [str(test_file)]
+def test_delete_selected_files_removes_file(app, qtbot, cbz_file):
+    _, path = cbz_file
+    app.loaded_files = [path]
     app.update_file_list()
     item = app.file_list.item(0)
     app.file_list.setCurrentItem(item)
     app.delete_selected_files()
-    assert str(test_file) not in app.loaded_files
+    assert path not in app.loaded_files
 
 
-def test_update_info_panel_displays_correct_info(app, qtbot, tmp_path):
-    test_file = tmp_path / "test.cbz"
-    test_file.write_text("dummy")
-    app.loaded_files = [str(test_file)]
+def test_update_info_panel_displays_correct_info(app, qtbot, cbz_file):
+    _, path = cbz_file
+    app.loaded_files = [path]
     app.update_info_panel()
     assert "Total: 1 files" in app.info_label.text()
     assert "CBZ: 1" in app.info_label.text()
 
 
-def test_get_selected_files_returns_loaded_files(app, qtbot, tmp_path):
-    test_file = tmp_path / "test.cbz"
+def test_get_selected_files_returns_loaded_files(app, qtbot, cbz_file):
+    _, path = cbz_file
+    app.loaded_files = [path]
+    assert app.get_selected_files() == [path]
+
+
+def test_update_info_panel_caches_file_stats(app, qtbot, tmp_path):
+    test_file = tmp_path / "test.pdf"
     test_file.write_text("dummy")
-    app.loaded_files = [str(test_file)]
-    assert app.get_selected_files() == [str(test_file)]
+    path = str(test_file)
+    app.loaded_files = [path]
+    app.update_info_panel()
+    test_file.unlink()
+    app.update_info_panel()
+    assert app.file_stats[path] == (5, ".pdf")
+    assert "PDF: 1" in app.info_label.text()
+
+
+def test_scan_archives_walks_subfolders_once(app, qtbot, tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.CBZ").write_text("dummy")
+    (tmp_path / "sub" / "b.pdf").write_text("dummy!")
+    (tmp_path / "notes.txt").write_text("skip")
+    found = app._scan_archives(str(tmp_path))
+    assert sorted(found) == [str(tmp_path / "a.CBZ"), str(tmp_path / "sub" / "b.pdf")]
+    assert app.file_stats[str(tmp_path / "sub" / "b.pdf")] == (6, ".pdf")
+
+
+def test_add_files_skips_already_loaded(app, qtbot, cbz_file, monkeypatch):
+    _, path = cbz_file
+    monkeypatch.setattr("PyQt6.QtWidgets.QFileDialog.getOpenFileNames", lambda *a, **kw: ([path], ""))
+    app.add_files()
+    app.add_files()
+    assert app.loaded_files == [path]
+    assert app.file_list.count() == 1
+
+
+def test_files_changed_is_debounced(app, qtbot, tmp_path):
+    a, b = str(tmp_path / "a.cbz"), str(tmp_path / "b.cbz")
+    called = []
+    app.files_changed.connect(lambda files: called.append(files))
+    with qtbot.waitSignal(app.files_changed, timeout=1000):
+        app.add_loaded_files([a])
+        app.schedule_files_changed()
+        app.add_loaded_files([b])
+        app.schedule_files_changed()
+    qtbot.wait(app.FILES_CHANGED_DEBOUNCE_MS * 2)
+    assert called == [[a, b]]
@@ -1,41 +1,49 @@
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
 from utils.logger import (
     setup_logging,
     get_operation_logger,
     log_operation_start,
-    log_operation_end
+    log_operation_end,
+    flush_logging
 )
 
 
-def test_setup_logging_creates_logs_dir(tmp_path, monkeypatch):
-    # Patch Path to use tmp_path for logs
-    monkeypatch.setattr("utils.logger.Path", lambda p="logs": tmp_path / "logs")
+@pytest.fixture(autouse=True)
+def truncate_logs(logs_dir):
+    # Empty the log files between tests instead of tearing the handlers down
+    yield
+    flush_logging()
+    if logs_dir.exists():
+        for log_file in logs_dir.iterdir():
+            open(log_file, "w").close()
+
+
+def test_setup_logging_creates_logs_dir(logs_dir):
     setup_logging(logging.DEBUG)
-    logs_dir = tmp_path / "logs"
     assert logs_dir.exists()
     assert (logs_dir / "comic_toolkit_main.log").exists()
 
 
-def test_get_operation_logger_creates_file(tmp_path, monkeypatch):
-    monkeypatch.setattr("utils.logger.Path", lambda p="logs": tmp_path / "logs")
+def test_get_operation_logger_creates_file(logs_dir):
     logger = get_operation_logger("convert")
-    logs_dir = tmp_path / "logs"
     log_file = logs_dir / "convert_operations.log"
     logger.info("Test log entry")
+    flush_logging()  # Records are written by a listener thread
     assert log_file.exists()
     with open(log_file, encoding="utf-8") as f:
         content = f.read()
     assert "Test log entry" in content
 
 
-def test_log_operation_start_and_end(tmp_path, monkeypatch):
-    monkeypatch.setattr("utils.logger.Path", lambda p="logs": tmp_path / "logs")
+def test_log_operation_start_and_end(logs_dir):
     log_operation_start("shrink", details="Shrink test details")
     log_operation_end("shrink", success=True, details="Shrink completed")
-    logs_dir = tmp_path / "logs"
+    flush_logging()
     log_file = logs_dir / "shrink_operations.log"
     assert log_file.exists()
     with open(log_file, encoding="utf-8") as f:
@@ -46,11 +54,25 @@ def test_log_operation_start_and_end(tmp_path, monkeypatch):
     assert "Details: Shrink completed" in content
 
 
-def test_get_operation_logger_no_duplicate_handlers(tmp_path, monkeypatch):
-    monkeypatch.setattr("utils.logger.Path", lambda p="logs": tmp_path / "logs")
+def test_get_operation_logger_no_duplicate_handlers(logs_dir):
     # Use logger to check handler count
     logger = get_operation_logger("convert")
     handler_count = len(logger.handlers)
     # Get logger again and check handler count is unchanged (no duplicates)
     logger2 = get_operation_logger("convert")
     assert len(logger2.handlers) == handler_count
+
+
+def test_queued_records_are_written_at_exit(tmp_path):
+    # A process that exits without calling shutdown_logging must not lose records
+    src = Path(__file__).resolve().parent.parent / "src" / "capt_archive_converter"
+    script = (
+        "from utils.logger import get_operation_logger\n"
+        "logger = get_operation_logger('exit')\n"
+        "for i in range(500):\n"
+        "    logger.info('record %d', i)\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=tmp_path, check=True,
+                   env={**os.environ, "PYTHONPATH": f"{src.parent}{os.pathsep}{src}"})
+    content = (tmp_path / "logs" / "exit_operations.log").read_text(encoding="utf-8")
+    assert "record 499" in content
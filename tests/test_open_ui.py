@@ -1,13 +1,13 @@
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from main import ConvertWindow
 from pytestqt.qtbot import QtBot
 import pytest
 
+pytestmark = pytest.mark.xdist_group("qt")
+
 
 @pytest.fixture
 def app(qtbot: QtBot):
+    # Imported here so collection does not load the whole GUI
+    from main import ConvertWindow
     window = ConvertWindow()
     qtbot.addWidget(window)
     return window
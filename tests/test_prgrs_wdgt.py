@@ -1,20 +1,34 @@
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import pytest
 from widgets.prgrs_wdgt import ProgressWidget
+from conftest import disconnect_all
 
+pytestmark = pytest.mark.xdist_group("qt")
 
-@pytest.fixture
-def widget(qtbot):
+
+@pytest.fixture(scope="module")
+def shared_widget(qapp):
     w = ProgressWidget()
-    qtbot.addWidget(w)
-    return w
+    yield w
+    w.close()
+    w.deleteLater()
 
 
-def test_widget_initialization(widget):
-    assert widget.progress_text.toPlainText().startswith("Ready to start")
-    assert widget.progress_bar.value() == 0
+@pytest.fixture
+def widget(shared_widget):
+    # Reset the shared widget to a cleared state before every test
+    shared_widget.clear()
+    shared_widget.rate_window_count = 0
+    yield shared_widget
+    disconnect_all(shared_widget.message_appended)
+    disconnect_all(shared_widget.progress_updated)
+
+
+def test_widget_initialization(qtbot):
+    # Reads constructor state, so it needs a fresh widget
+    w = ProgressWidget()
+    qtbot.addWidget(w)
+    assert w.progress_text.toPlainText().startswith("Ready to start")
+    assert w.progress_bar.value() == 0
 
 
 def test_append_message_updates_text_and_emits_signal(widget, qtbot):
@@ -25,6 +39,14 @@ def test_append_message_updates_text_and_emits_signal(widget, qtbot):
     assert called and called[0] == "Processing started"
 
 
+def test_append_status_includes_current_progress(widget):
+    widget.append_status("Extracting")
+    assert "Extracting" in widget.progress_text.toPlainText()
+    widget.set_progress(40)
+    widget.append_status("Packing")
+    assert "Packing (40%)" in widget.progress_text.toPlainText()
+
+
 def test_set_progress_updates_bar_and_emits_signal(widget, qtbot):
     called = []
     widget.progress_updated.connect(lambda val: called.append(val))
@@ -39,3 +61,13 @@ def test_clear_resets_text_and_bar(widget):
     widget.clear()
     assert widget.progress_text.toPlainText() == ""
     assert widget.progress_bar.value() == 0
+
+
+def test_append_message_batches_bursts(widget):
+    burst = ProgressWidget.MAX_IMMEDIATE_MESSAGES_PER_SEC + 5
+    for i in range(burst):
+        widget.append_message(f"line {i}")
+    assert widget.pending_messages  # Overflow is buffered, not appended yet
+    widget.flush_messages()
+    assert not widget.pending_messages
+    assert f"line {burst - 1}" in widget.progress_text.toPlainText()